@@ -0,0 +1,364 @@
+# IMPORTS
+import io
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pdfplumber
+
+from emec.texto import limpar_texto, pdf_para_texto
+from emec.extracao import (
+    criar_estrutura_base,
+    extrair_informacoes_curso,
+    extrair_notas_justificativas,
+    extrair_todos_itens,
+    inserir_dados
+)
+from emec.saidas import json_para_excel
+
+# 1. GERADOR DE RELATÓRIOS SINTÉTICOS
+# Escreve um PDF mínimo (fonte Helvetica, texto em WinAnsi) imitando um
+# relatório do e-MEC impresso pelo Firefox: cabeçalho/rodapé do navegador,
+# dados do curso, seção DOCENTES e as três dimensões com seus itens.
+# Não depende de nenhuma biblioteca além da padrão.
+LINHAS_POR_PAGINA = 60
+
+PALAVRAS = (
+    "curso projeto pedagógico docentes discentes atividades ensino "
+    "pesquisa extensão estágio acervo bibliografia laboratório práticas "
+    "componentes curriculares atendimento coordenação colegiado avaliação "
+    "metodologia tecnologias comunicação acessibilidade infraestrutura"
+).split()
+
+def _frase(r: random.Random, minimo: int, maximo: int) -> str:
+    return " ".join(r.choice(PALAVRAS) for _ in range(r.randint(minimo, maximo)))
+
+def _escapar(texto: str) -> str:
+    return texto.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def _pdf_bytes(paginas: list) -> bytes:
+    objetos = []
+
+    def adicionar(conteudo: bytes) -> int:
+        objetos.append(conteudo)
+        return len(objetos)
+
+    fonte = adicionar(
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+        b"/Encoding /WinAnsiEncoding >>"
+    )
+    raiz_paginas = adicionar(b"")
+
+    filhos = []
+    for linhas in paginas:
+        comandos = ["BT /F1 9 Tf 11 TL 30 810 Td"]
+        comandos += [f"({_escapar(linha)}) Tj T*" for linha in linhas]
+        comandos.append("ET")
+        fluxo = "\n".join(comandos).encode("cp1252", errors="replace")
+
+        conteudo = adicionar(
+            b"<< /Length %d >>\nstream\n" % len(fluxo) + fluxo + b"\nendstream"
+        )
+        filhos.append(adicionar(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+            b"/Contents %d 0 R /Resources << /Font << /F1 %d 0 R >> >> >>"
+            % (raiz_paginas, conteudo, fonte)
+        ))
+
+    objetos[raiz_paginas - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % f for f in filhos),
+        len(filhos)
+    )
+    catalogo = adicionar(b"<< /Type /Catalog /Pages %d 0 R >>" % raiz_paginas)
+
+    saida = bytearray(b"%PDF-1.4\n")
+    deslocamentos = []
+    for numero, conteudo in enumerate(objetos, start=1):
+        deslocamentos.append(len(saida))
+        saida += b"%d 0 obj\n" % numero + conteudo + b"\nendobj\n"
+
+    inicio_xref = len(saida)
+    saida += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objetos) + 1)
+    saida += b"".join(b"%010d 00000 n \n" % d for d in deslocamentos)
+    saida += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objetos) + 1,
+        catalogo,
+        inicio_xref
+    )
+    return bytes(saida)
+
+def gerar_relatorio_sintetico(
+    caminho_pdf: Path,
+    paginas: int = 20,
+    itens_por_dimensao: int = 12,
+    docentes: int = 15,
+    protocolo: str = "202300001",
+    semente: int = 0
+) -> Path:
+    r = random.Random(semente)
+
+    linhas = [
+        f"Protocolo: {protocolo}",
+        "Código MEC: 1234567",
+        "Curso(s) / Habilitação(ões) sendo avaliado(s):",
+        "ADMINISTRAÇÃO",
+        "Informações da comissão:",
+        "Endereço da IES: 12345 - UNASP campus Engenheiro Coelho - Estrada Municipal",
+        "Ato Regulatório: Reconhecimento",
+        f"Data de 12/03/{2018 + semente % 7} a 15/03/{2018 + semente % 7}",
+        "CONCEITO FINAL CONTÍNUO CONCEITO FINAL FAIXA",
+        f"{r.randint(2, 4)},{r.randint(10, 99)} {r.randint(2, 5)}",
+    ]
+
+    secao_docentes = [
+        "DOCENTES",
+        "Nome do Docente Titulação Regime de Trabalho Vínculo Empregatício "
+        "Tempo de vínculo ininterrupto do docente com o curso (em meses)",
+    ]
+    for i in range(docentes):
+        secao_docentes.append(
+            f"Docente {i} {r.choice(PALAVRAS).capitalize()} "
+            f"{r.choice(['Doutorado', 'Mestrado', 'Especialização'])} "
+            f"{r.choice(['Integral', 'Parcial', 'Horista'])} "
+            f"{r.choice(['CLT', 'Outro'])} {r.randint(1, 120)} Mês(es)"
+        )
+    secao_docentes.append("CATEGORIAS AVALIADAS")
+
+    dimensoes = []
+    for dimensao in (1, 2, 3):
+        dimensoes.append(f"Dimensão {dimensao}: {_frase(r, 2, 4).upper()}")
+        for item in range(1, itens_por_dimensao + 1):
+            dimensoes.append(f"{dimensao}.{item}. {_frase(r, 4, 10).capitalize()}.")
+            if r.random() < 0.85:
+                dimensoes.append(str(r.choice([1, 2, 3, 4, 5])))
+                dimensoes.append(f"Justificativa para conceito {r.choice('12345')}:")
+                for _ in range(r.randint(1, 5)):
+                    dimensoes.append(_frase(r, 8, 16).capitalize() + ".")
+
+    # completa com páginas descritivas (comissão, IES, PPC) até o total
+    # de páginas pedido, antes das seções que o pipeline extrai
+    util = LINHAS_POR_PAGINA - 3
+    faltam = paginas * util - len(linhas) - len(secao_docentes) - len(dimensoes)
+    linhas += [_frase(r, 8, 16).capitalize() + "." for _ in range(max(faltam, 0))]
+    linhas += secao_docentes + dimensoes
+
+    total = max(paginas, -(-len(linhas) // util))
+    conteudo_paginas = []
+    for numero in range(total):
+        bloco = linhas[numero * util:(numero + 1) * util]
+        conteudo_paginas.append(
+            ["about:blank", f"Firefox 12/03/2023 10:{numero % 60:02d}:00"]
+            + bloco
+            + [f"Página {numero + 1} de {total}"]
+        )
+
+    caminho_pdf.write_bytes(_pdf_bytes(conteudo_paginas))
+    return caminho_pdf
+
+# 2. MEDIÇÃO POR ETAPA
+def _etapas(pdf: Path, pasta_temp: Path) -> list:
+    estado = {}
+
+    def texto():
+        estado["bruto"] = pdf_para_texto(pdf)
+
+    def limpeza():
+        estado["texto"] = limpar_texto(estado["bruto"])
+
+    def todos_itens():
+        estado["itens"] = extrair_todos_itens(estado["texto"])
+
+    def notas():
+        estado["avaliados"] = extrair_notas_justificativas(estado["texto"])
+
+    def info_curso():
+        estado["info"] = extrair_informacoes_curso(estado["texto"])
+
+    def excel():
+        estrutura = criar_estrutura_base()
+        estrutura["Informações curso"].update(estado["info"])
+        itens = dict(estado["itens"])
+        itens.update(estado["avaliados"])
+        inserir_dados(estrutura, itens)
+        json_para_excel(estrutura, pasta_temp / "bench.xlsx")
+
+    return [
+        ("pdf_para_texto", texto),
+        ("limpar_texto", limpeza),
+        ("extrair_todos_itens", todos_itens),
+        ("extrair_notas_justificativas", notas),
+        ("extrair_informacoes_curso", info_curso),
+        ("json_para_excel", excel),
+    ]
+
+def medir(pdf: Path, repeticoes: int = 3) -> dict:
+    paginas = contar_paginas(pdf)
+
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+
+        # tempo: melhor de N, sem tracemalloc (que distorce os tempos)
+        tempos = {}
+        for _ in range(repeticoes):
+            for nome, etapa in _etapas(pdf, temp):
+                inicio = time.perf_counter()
+                _silencioso(etapa)
+                decorrido = time.perf_counter() - inicio
+                tempos[nome] = min(tempos.get(nome, decorrido), decorrido)
+
+        # memória: pico de cada etapa numa passada separada
+        memoria = {}
+        tracemalloc.start()
+        try:
+            for nome, etapa in _etapas(pdf, temp):
+                tracemalloc.reset_peak()
+                _silencioso(etapa)
+                memoria[nome] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    total = sum(tempos.values())
+    return {
+        "pdf": pdf.name,
+        "paginas": paginas,
+        "tempo_total_s": round(total, 4),
+        "paginas_por_segundo": round(paginas / tempos["pdf_para_texto"], 2),
+        "etapas": {
+            nome: {
+                "tempo_s": round(tempos[nome], 4),
+                "pico_memoria_mb": round(memoria[nome] / 1024 / 1024, 2)
+            }
+            for nome in tempos
+        }
+    }
+
+def contar_paginas(pdf: Path) -> int:
+    with pdfplumber.open(pdf) as documento:
+        return len(documento.pages)
+
+def _silencioso(funcao) -> None:
+    # as funções do pipeline imprimem o progresso; aqui só interessa o tempo
+    with redirect_stdout(io.StringIO()):
+        funcao()
+
+# 3. COMPARAÇÃO COM A LINHA DE BASE
+def comparar(resultados: dict, base: dict, tolerancia: float) -> list:
+    regressoes = []
+
+    for atual in resultados["cenarios"]:
+        anterior = next(
+            (c for c in base.get("cenarios", []) if c["nome"] == atual["nome"]),
+            None
+        )
+        if not anterior:
+            continue
+
+        for etapa, dados in atual["etapas"].items():
+            antes = anterior["etapas"].get(etapa, {}).get("tempo_s")
+            if not antes:
+                continue
+            variacao = (dados["tempo_s"] - antes) / antes
+            if variacao > tolerancia:
+                regressoes.append(
+                    f"{atual['nome']} / {etapa}: "
+                    f"{antes:.4f}s → {dados['tempo_s']:.4f}s (+{variacao:.0%})"
+                )
+
+    return regressoes
+
+def imprimir_resultado(cenario: dict) -> None:
+    print(
+        f"\n📊 {cenario['nome']}: {cenario['paginas']} páginas, "
+        f"{cenario['tempo_total_s']:.3f}s, "
+        f"{cenario['paginas_por_segundo']} páginas/s"
+    )
+    print(f"   {'etapa':<32}{'tempo (s)':>12}{'pico (MB)':>12}")
+    for etapa, dados in cenario["etapas"].items():
+        print(
+            f"   {etapa:<32}{dados['tempo_s']:>12.4f}"
+            f"{dados['pico_memoria_mb']:>12.2f}"
+        )
+
+# 4. EXECUÇÃO
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Mede cada etapa do pipeline com relatórios sintéticos."
+    )
+    parser.add_argument(
+        "--paginas",
+        type=int,
+        nargs="+",
+        default=[10, 50, 100],
+        help="tamanhos (em páginas) dos relatórios gerados"
+    )
+    parser.add_argument(
+        "--itens",
+        type=int,
+        default=12,
+        help="itens por dimensão em cada relatório (padrão: 12)"
+    )
+    parser.add_argument(
+        "--repeticoes",
+        type=int,
+        default=3,
+        help="repetições por cenário; vale o melhor tempo (padrão: 3)"
+    )
+    parser.add_argument(
+        "--saida",
+        type=Path,
+        default=Path("benchmark_resultados.json"),
+        help="onde gravar os resultados desta execução"
+    )
+    parser.add_argument(
+        "--base",
+        type=Path,
+        help="resultados anteriores para comparar (linha de base)"
+    )
+    parser.add_argument(
+        "--tolerancia",
+        type=float,
+        default=0.20,
+        help="aumento de tempo aceito antes de acusar regressão (padrão: 0.20)"
+    )
+    args = parser.parse_args()
+
+    resultados = {
+        "data": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pdfplumber": pdfplumber.__version__,
+        "cenarios": []
+    }
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for paginas in args.paginas:
+            pdf = gerar_relatorio_sintetico(
+                Path(pasta) / f"sintetico_{paginas}.pdf",
+                paginas=paginas,
+                itens_por_dimensao=args.itens
+            )
+            cenario = medir(pdf, args.repeticoes)
+            cenario["nome"] = f"{paginas}p_{args.itens}itens"
+            resultados["cenarios"].append(cenario)
+            imprimir_resultado(cenario)
+
+    args.saida.write_text(
+        json.dumps(resultados, ensure_ascii=False, indent=4),
+        encoding="utf-8"
+    )
+    print(f"\n✅ Resultados gravados: {args.saida}")
+
+    if args.base:
+        base = json.loads(args.base.read_text(encoding="utf-8"))
+        regressoes = comparar(resultados, base, args.tolerancia)
+        if regressoes:
+            print("\n❌ Regressões em relação à linha de base:")
+            for linha in regressoes:
+                print(f"   {linha}")
+            raise SystemExit(1)
+        print("\n✅ Nenhuma regressão em relação à linha de base.")
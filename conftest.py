@@ -0,0 +1 @@
+# raiz do repositório no sys.path: os testes importam emec e benchmark
@@ -0,0 +1,5 @@
+# Conversão dos relatórios de avaliação do e-MEC (PDF) em JSON e Excel.
+#
+# pdfplumber, pandas e openpyxl são importados só dentro das funções que
+# os usam: o --help, a sonda com acerto no cache e a consulta ao índice
+# não pagam o tempo de carregar essas bibliotecas.
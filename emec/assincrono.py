@@ -0,0 +1,315 @@
+# Modo assíncrono do lote: três estágios ligados por filas limitadas
+#
+#   leitura (thread)  ->  extração (processos)  ->  gravação (thread)
+#   bytes do PDF          sonda, texto, JSON,       JSON, Excel, índice,
+#                         docentes                  consolidado/exportação
+#
+# Enquanto os processos extraem, o próximo PDF já está sendo lido do disco
+# (ou do compartilhamento de rede) e os resultados anteriores estão sendo
+# gravados. Fila cheia faz o estágio anterior esperar (contrapressão), então
+# a memória fica limitada a fila_leitura PDFs lidos + fila_gravacao
+# resultados, além dos que estão nos workers.
+#
+# Ctrl+C para a leitura e descarta os PDFs lidos que ainda não começaram;
+# os que estão nos workers terminam e são gravados, e as saídas agregadas
+# são fechadas normalmente. Um segundo Ctrl+C interrompe na hora.
+import sys
+import signal
+import asyncio
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .indice import IndiceProtocolos
+from .medicao import SEM_MEDICAO, MedicaoPDF, RelatorioExecucao
+from .motores import MOTOR_PADRAO, imprimir_uso_motores
+from .lote import (
+    _analisar_pdf_worker,
+    _gravar_no_principal,
+    _iniciar_worker,
+    _registrar_erro,
+    ResultadoPDF,
+    abrir_saidas
+)
+
+_FIM = None  # marca de fim de fila
+
+def _criar_executor(
+    workers: int,
+    arquivos_por_worker: int,
+    pasta_saida_excel: Path,
+    pasta_cache: Path,
+    cache_limite_mb: int,
+    motor: str,
+    paginas_verificacao: int
+) -> ProcessPoolExecutor:
+    opcoes = {
+        "max_workers": workers,
+        "initializer": _iniciar_worker,
+        "initargs": (
+            pasta_saida_excel,
+            pasta_cache,
+            cache_limite_mb,
+            motor,
+            paginas_verificacao
+        )
+    }
+    # reciclagem dos processos só existe a partir do Python 3.11
+    if arquivos_por_worker and sys.version_info >= (3, 11):
+        opcoes["max_tasks_per_child"] = arquivos_por_worker
+    return ProcessPoolExecutor(**opcoes)
+
+async def _ler(
+    pdfs: list,
+    fila_leitura: asyncio.Queue,
+    fila_gravacao: asyncio.Queue,
+    extratores: int,
+    parar: asyncio.Event,
+    instrumentar: bool
+) -> None:
+    for pdf in pdfs:
+        if parar.is_set():
+            break
+
+        medicao = MedicaoPDF(pdf) if instrumentar else SEM_MEDICAO
+        try:
+            with medicao.etapa("leitura_arquivo"):
+                conteudo = await asyncio.to_thread(pdf.read_bytes)
+        except OSError as e:
+            _registrar_erro(pdf, e, medicao)
+            await fila_gravacao.put(("", None, medicao, Counter()))
+            continue
+
+        await fila_leitura.put((pdf, conteudo, medicao))
+
+    for _ in range(extratores):
+        await fila_leitura.put(_FIM)
+
+async def _extrair(
+    fila_leitura: asyncio.Queue,
+    fila_gravacao: asyncio.Queue,
+    executor: ProcessPoolExecutor,
+    opcoes: dict,
+    parar: asyncio.Event
+) -> None:
+    loop = asyncio.get_running_loop()
+
+    while True:
+        item = await fila_leitura.get()
+        if item is _FIM:
+            break
+        if parar.is_set():
+            continue  # lido, mas não iniciado: fica para a próxima execução
+
+        pdf, conteudo, medicao = item
+        resultado = await loop.run_in_executor(
+            executor,
+            _analisar_pdf_worker,
+            (pdf, conteudo, opcoes, medicao)
+        )
+        await fila_gravacao.put(resultado)
+
+    await fila_gravacao.put(_FIM)
+
+def _gravar_um(
+    resultado: ResultadoPDF,
+    indice: IndiceProtocolos,
+    saidas: list,
+    opcoes: dict,
+    medicao: MedicaoPDF,
+    reprocessar_desatualizados: bool
+) -> None:
+    # dois PDFs com o mesmo protocolo no lote: os workers não se enxergam,
+    # então a conferência final é no índice do processo principal
+    if not _gravar_no_principal(
+        resultado,
+        indice,
+        opcoes,
+        medicao,
+        reprocessar_desatualizados
+    ):
+        return
+
+    for destino in saidas:
+        destino.adicionar(resultado.dados)
+
+async def _gravar(
+    fila_gravacao: asyncio.Queue,
+    extratores: int,
+    indice: IndiceProtocolos,
+    saidas: list,
+    opcoes: dict,
+    execucao: RelatorioExecucao,
+    usos_motores: Counter,
+    reprocessar_desatualizados: bool
+) -> None:
+    restantes = extratores
+
+    while restantes:
+        item = await fila_gravacao.get()
+        if item is _FIM:
+            restantes -= 1
+            continue
+
+        saida, resultado, medicao, usos = item
+        print(saida, end="")
+        usos_motores.update(usos)
+
+        if resultado:
+            await asyncio.to_thread(
+                _gravar_um,
+                resultado,
+                indice,
+                saidas,
+                opcoes,
+                medicao,
+                reprocessar_desatualizados
+            )
+
+        if execucao:
+            execucao.adicionar(medicao.registro)
+
+async def _executar(
+    pdfs: list,
+    executor: ProcessPoolExecutor,
+    indice: IndiceProtocolos,
+    saidas: list,
+    execucao: RelatorioExecucao,
+    usos_motores: Counter,
+    opcoes_analise: dict,
+    opcoes_gravacao: dict,
+    extratores: int,
+    fila_leitura: int,
+    fila_gravacao: int
+) -> None:
+    loop = asyncio.get_running_loop()
+    parar = asyncio.Event()
+
+    def interromper(sinal, quadro) -> None:
+        print("\n🛑 Encerrando: terminando os PDFs em andamento...", flush=True)
+        # o segundo Ctrl+C volta ao comportamento padrão (interrompe na hora)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        loop.call_soon_threadsafe(parar.set)
+
+    anterior = signal.signal(signal.SIGINT, interromper)
+
+    lidos = asyncio.Queue(maxsize=fila_leitura)
+    extraidos = asyncio.Queue(maxsize=fila_gravacao)
+
+    try:
+        await asyncio.gather(
+            _ler(pdfs, lidos, extraidos, extratores, parar, execucao is not None),
+            *(
+                _extrair(lidos, extraidos, executor, opcoes_analise, parar)
+                for _ in range(extratores)
+            ),
+            _gravar(
+                extraidos,
+                extratores,
+                indice,
+                saidas,
+                opcoes_gravacao,
+                execucao,
+                usos_motores,
+                opcoes_analise["reprocessar_desatualizados"]
+            )
+        )
+    finally:
+        signal.signal(signal.SIGINT, anterior)
+
+def processar_pasta_assincrono(
+    pasta_pdfs: Path,
+    pasta_saida_json: Path,
+    pasta_saida_excel: Path,
+    workers: int = 1,
+    arquivos_por_worker: int = 50,
+    reconstruir_indice: bool = False,
+    reprocessar_desatualizados: bool = False,
+    paginas_sonda: int = 1,
+    leitura_seletiva: bool = True,
+    motor: str = MOTOR_PADRAO,
+    paginas_verificacao: int = 1,
+    pasta_cache: Path = None,
+    cache_limite_mb: int = 1024,
+    consolidado: Path = None,
+    consolidado_por_dimensao: bool = False,
+    excel_por_protocolo: bool = True,
+    json_por_protocolo: bool = True,
+    exportar: str = None,
+    destino_exportacao: Path = None,
+    base_consulta: Path = None,
+    ndjson: Path = None,
+    log_execucao: Path = None,
+    fila_leitura: int = None,
+    fila_gravacao: int = None
+) -> None:
+    pasta_saida_json.mkdir(parents=True, exist_ok=True)
+    pasta_saida_excel.mkdir(parents=True, exist_ok=True)
+
+    indice = IndiceProtocolos(pasta_saida_excel, reconstruir=reconstruir_indice)
+
+    pdfs = sorted(pasta_pdfs.glob("*.pdf"))
+
+    if not pdfs:
+        print("⚠️ Nenhum PDF encontrado na pasta.")
+        return
+
+    workers = max(workers, 1)
+
+    saidas = abrir_saidas(
+        consolidado,
+        consolidado_por_dimensao,
+        exportar,
+        destino_exportacao,
+        base_consulta,
+        ndjson,
+        substituir=reprocessar_desatualizados
+    )
+    execucao = RelatorioExecucao(log_execucao) if log_execucao else None
+    usos_motores = Counter()  # PDFs extraídos por motor, somados dos workers
+
+    opcoes_analise = {
+        "pasta_saida_excel": pasta_saida_excel,
+        "paginas_sonda": paginas_sonda,
+        "leitura_seletiva": leitura_seletiva,
+        "excel_por_protocolo": excel_por_protocolo,
+        "reprocessar_desatualizados": reprocessar_desatualizados
+    }
+    opcoes_gravacao = {
+        "pasta_saida_json": pasta_saida_json,
+        "pasta_saida_excel": pasta_saida_excel,
+        "excel_por_protocolo": excel_por_protocolo,
+        "json_por_protocolo": json_por_protocolo
+    }
+
+    executor = _criar_executor(
+        workers,
+        arquivos_por_worker,
+        pasta_saida_excel,
+        pasta_cache,
+        cache_limite_mb,
+        motor,
+        paginas_verificacao
+    )
+
+    try:
+        with executor:
+            asyncio.run(_executar(
+                pdfs,
+                executor,
+                indice,
+                saidas,
+                execucao,
+                usos_motores,
+                opcoes_analise,
+                opcoes_gravacao,
+                extratores=workers,
+                fila_leitura=fila_leitura or 2 * workers,
+                fila_gravacao=fila_gravacao or 2 * workers
+            ))
+    finally:
+        for destino in saidas:
+            destino.fechar()
+        if execucao:
+            execucao.fechar()
+        imprimir_uso_motores(usos_motores)
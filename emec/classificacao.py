@@ -0,0 +1,74 @@
+# Pré-classificação das páginas
+#
+# A extração com layout do pdfplumber custa centenas de milissegundos por
+# página; o texto cru do pdfium (já instalado com o pdfplumber) sai em
+# poucos milissegundos. Com ele, um passe rápido decide quais páginas
+# contribuem para o resultado e só essas passam pelo extract_text():
+#   - cabeçalho: as mesmas páginas em que extrair_informacoes_curso procura
+#     os campos do curso (ver fim_cabecalho, em extracao.py);
+#   - a seção DOCENTES;
+#   - a avaliação: da primeira página com "Dimensão N" até a tabela do
+#     CONCEITO FINAL, que pode continuar na página seguinte
+#     (paginas_conceito), ou até o fim, se ele não vier depois das
+#     dimensões.
+# As demais (contextualização, anexos depois do conceito final) saem como
+# "" para manter a numeração das páginas. Sem pdfium, ou se o passe rápido
+# não achar o protocolo, o curso ou as dimensões, todas as páginas são
+# extraídas como antes.
+from .extracao import (
+    PADRAO_DIMENSAO,
+    fim_cabecalho,
+    localizar_paginas_docentes,
+    paginas_conceito,
+    primeira_pagina
+)
+from .texto import fonte_pdf
+
+def textos_rapidos(caminho_pdf) -> list:
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+
+    documento = pypdfium2.PdfDocument(fonte_pdf(caminho_pdf))
+    try:
+        textos = []
+        for indice in range(len(documento)):
+            pagina = documento[indice]
+            texto = pagina.get_textpage()
+            try:
+                textos.append(texto.get_text_range().replace("\r\n", "\n"))
+            finally:
+                texto.close()
+                pagina.close()
+        return textos
+    finally:
+        documento.close()
+
+def paginas_relevantes(textos: list) -> set:
+    ultima_cabecalho = fim_cabecalho(textos)
+    if ultima_cabecalho is None:
+        return None
+
+    inicio_avaliacao = primeira_pagina(PADRAO_DIMENSAO, textos)
+    if inicio_avaliacao is None:
+        return None
+
+    tabela_conceito = paginas_conceito(textos)
+    fim_avaliacao = tabela_conceito[-1] if tabela_conceito else len(textos) - 1
+
+    relevantes = set(range(ultima_cabecalho + 1))
+    relevantes.update(localizar_paginas_docentes(textos))
+    relevantes.update(range(inicio_avaliacao, fim_avaliacao + 1))
+    return relevantes
+
+# None = extrair todas as páginas
+def classificar_paginas(caminho_pdf) -> set:
+    textos = textos_rapidos(caminho_pdf)
+    if not textos:
+        return None
+
+    relevantes = paginas_relevantes(textos)
+    if relevantes is None or len(relevantes) == len(textos):
+        return None
+    return relevantes
@@ -0,0 +1,467 @@
+# Linha de comando: "single" converte um PDF, "batch" uma pasta inteira e
+# "consulta" pergunta à base SQLite gerada com --base-consulta.
+# Os módulos de processamento só são importados depois do parse dos
+# argumentos, então o --help responde sem carregar nada pesado.
+import argparse
+from pathlib import Path
+
+AJUDA_TODAS_AS_PAGINAS = (
+    "extrai o texto de todas as páginas, sem a pré-classificação que pula "
+    "contextualização e anexos"
+)
+
+MOTORES = ["auto", "pdfium", "pdfminer", "pdfplumber"]
+
+# relatórios por bloco do --vetorizado (o mesmo de tabela.TAMANHO_BLOCO)
+TAMANHO_BLOCO = 200
+
+def _opcoes_motor(comando: argparse.ArgumentParser) -> None:
+    comando.add_argument(
+        "--motor",
+        choices=MOTORES,
+        default="pdfplumber",
+        help=(
+            "motor de extração do texto (padrão: pdfplumber); os rápidos "
+            "(pdfium, pdfminer; auto = pdfium, se instalado) conferem "
+            "algumas páginas de cada PDF com o pdfplumber e recuam para ele "
+            "se o texto diferir"
+        )
+    )
+    comando.add_argument(
+        "--paginas-verificacao",
+        type=int,
+        default=1,
+        help="páginas de cada PDF conferidas com o pdfplumber (padrão: 1; 0 = não conferir)"
+    )
+
+def _anunciar_motor(args: argparse.Namespace) -> None:
+    from .motores import resolver_motor
+
+    motor = resolver_motor(args.motor)
+    if motor == "pdfplumber":
+        print("🔧 Motor de extração: pdfplumber")
+    else:
+        print(
+            f"🔧 Motor de extração: {motor} "
+            f"({args.paginas_verificacao} página(s) por PDF conferida(s) com o pdfplumber)"
+        )
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="emec",
+        description="Converte os relatórios do e-MEC em JSON e Excel."
+    )
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    # UM PDF
+    single = comandos.add_parser(
+        "single",
+        help="converte um único PDF",
+        description="Converte um único PDF em JSON e Excel."
+    )
+    single.add_argument("pdf", type=Path, help="relatório em PDF")
+    single.add_argument(
+        "--json",
+        type=Path,
+        help="arquivo JSON de saída (padrão: ao lado do PDF)"
+    )
+    single.add_argument(
+        "--excel",
+        type=Path,
+        help="arquivo Excel de saída (padrão: ao lado do PDF)"
+    )
+    single.add_argument(
+        "--docentes",
+        type=Path,
+        help="gera também a planilha de docentes neste caminho"
+    )
+    single.add_argument(
+        "--todas-as-paginas",
+        action="store_true",
+        help=AJUDA_TODAS_AS_PAGINAS
+    )
+    _opcoes_motor(single)
+
+    # PASTA DE PDFs
+    batch = comandos.add_parser(
+        "batch",
+        help="converte todos os PDFs de uma pasta",
+        description=(
+            "Converte todos os PDFs de uma pasta. As saídas ficam, por "
+            "padrão, ao lado da pasta de PDFs (JSON/, EXCEL/, CACHE/...)."
+        )
+    )
+    batch.add_argument("pasta_pdfs", type=Path, help="pasta com os relatórios em PDF")
+    batch.add_argument(
+        "--json",
+        type=Path,
+        help="pasta dos JSON gerados (padrão: JSON/ ao lado da pasta de PDFs)"
+    )
+    batch.add_argument(
+        "--excel",
+        type=Path,
+        help="pasta dos Excel gerados (padrão: EXCEL/ ao lado da pasta de PDFs)"
+    )
+    batch.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="quantidade de processos em paralelo (padrão: 1)"
+    )
+    batch.add_argument(
+        "--arquivos-por-worker",
+        type=int,
+        default=50,
+        help="recicla cada processo após N arquivos (0 = nunca)"
+    )
+    batch.add_argument(
+        "--reconstruir-indice",
+        action="store_true",
+        help="refaz o índice de protocolos a partir dos .xlsx existentes"
+    )
+    batch.add_argument(
+        "--reprocessar-desatualizados",
+        action="store_true",
+        help=(
+            "refaz só os protocolos gerados por outra versão do extrator ou "
+            "a partir de outro PDF (o texto em cache é reaproveitado)"
+        )
+    )
+    batch.add_argument(
+        "--paginas-sonda",
+        type=int,
+        default=1,
+        help="páginas lidas para achar o protocolo antes da leitura completa"
+    )
+    batch.add_argument(
+        "--todas-as-paginas",
+        action="store_true",
+        help=AJUDA_TODAS_AS_PAGINAS
+    )
+    _opcoes_motor(batch)
+    batch.add_argument(
+        "--cache",
+        type=Path,
+        help="pasta do cache de textos extraídos (padrão: CACHE/ ao lado da pasta de PDFs)"
+    )
+    batch.add_argument(
+        "--sem-cache",
+        action="store_true",
+        help="desativa o cache de textos extraídos"
+    )
+    batch.add_argument(
+        "--cache-limite-mb",
+        type=int,
+        default=1024,
+        help="tamanho máximo do cache em MB (padrão: 1024)"
+    )
+    batch.add_argument(
+        "--consolidado",
+        type=Path,
+        help="grava todos os cursos numa única planilha neste caminho"
+    )
+    batch.add_argument(
+        "--por-dimensao",
+        action="store_true",
+        help="na planilha consolidada, uma aba por dimensão"
+    )
+    batch.add_argument(
+        "--excel-por-protocolo",
+        action="store_true",
+        help="com --consolidado, gera também o {protocolo}.xlsx de cada PDF"
+    )
+    batch.add_argument(
+        "--ndjson",
+        type=Path,
+        help=(
+            "acrescenta um registro JSON compacto por relatório neste arquivo "
+            "(.gz ou .zst compactam); o JSON por protocolo deixa de ser gerado"
+        )
+    )
+    batch.add_argument(
+        "--json-por-protocolo",
+        action="store_true",
+        help="com --ndjson, gera também o {protocolo}.json formatado de cada PDF"
+    )
+    batch.add_argument(
+        "--exportar",
+        choices=["parquet", "csv"],
+        help="exporta também a base agregada em Parquet (por ano e ato) ou CSV.gz"
+    )
+    batch.add_argument(
+        "--destino-exportacao",
+        type=Path,
+        help="pasta do Parquet ou arquivo do CSV (padrão: ao lado da pasta de PDFs)"
+    )
+    batch.add_argument(
+        "--base-consulta",
+        type=Path,
+        help="alimenta esta base SQLite de consulta entre anos (ver o comando consulta)"
+    )
+    batch.add_argument(
+        "--pre-leitura",
+        type=int,
+        nargs="?",
+        const=4,
+        default=0,
+        metavar="N",
+        help=(
+            "lê cada PDF inteiro de uma vez, N à frente do processamento, e "
+            "o processa da memória; para pastas de rede (padrão: 4)"
+        )
+    )
+    batch.add_argument(
+        "--pre-leitura-mb",
+        type=int,
+        default=256,
+        help="com --pre-leitura, limite de MB de PDFs lidos e em uso (padrão: 256)"
+    )
+    batch.add_argument(
+        "--pasta-local",
+        type=Path,
+        help="com --pre-leitura, copia os PDFs para esta pasta local e os mapeia em memória"
+    )
+    batch.add_argument(
+        "--vetorizado",
+        type=int,
+        nargs="?",
+        const=TAMANHO_BLOCO,
+        default=0,
+        metavar="N",
+        help=(
+            "monta as avaliações em blocos de N relatórios numa única tabela "
+            f"pandas, num único processo (padrão: {TAMANHO_BLOCO})"
+        )
+    )
+    batch.add_argument(
+        "--assincrono",
+        action="store_true",
+        help="sobrepõe leitura dos PDFs, extração e gravação das saídas (asyncio)"
+    )
+    batch.add_argument(
+        "--fila-leitura",
+        type=int,
+        help="com --assincrono, PDFs lidos à frente da extração (padrão: 2 x workers)"
+    )
+    batch.add_argument(
+        "--fila-gravacao",
+        type=int,
+        help="com --assincrono, resultados aguardando gravação (padrão: 2 x workers)"
+    )
+    batch.add_argument(
+        "--vigiar",
+        action="store_true",
+        help="fica rodando e processa cada PDF novo assim que chega na pasta"
+    )
+    batch.add_argument(
+        "--intervalo",
+        type=float,
+        default=1.0,
+        help="no modo vigia, segundos entre verificações (padrão: 1)"
+    )
+    batch.add_argument(
+        "--estabilidade",
+        type=float,
+        default=2.0,
+        help="no modo vigia, segundos sem mudanças antes de ler o PDF (padrão: 2)"
+    )
+    batch.add_argument(
+        "--log-execucao",
+        type=Path,
+        help="grava tempos por PDF/etapa neste arquivo JSON-lines e mostra um resumo"
+    )
+
+    # BASE DE CONSULTA
+    consulta = comandos.add_parser(
+        "consulta",
+        help="consulta a base SQLite de avaliações",
+        description=(
+            "Consulta a base SQLite alimentada por batch --base-consulta: "
+            "evolução de um item ao longo dos anos, médias e NSA por item ou "
+            "por dimensão."
+        )
+    )
+    consulta.add_argument("base", type=Path, help="arquivo da base SQLite")
+    perguntas = consulta.add_subparsers(dest="pergunta", required=True)
+
+    item = perguntas.add_parser("item", help="um item ao longo dos anos")
+    item.add_argument("numero", help='número do item, ex.: "2.3"')
+    itens = perguntas.add_parser("itens", help="média da Nota e NSA por item")
+    dimensoes = perguntas.add_parser("dimensoes", help="média da Nota e NSA por dimensão")
+    importar = perguntas.add_parser(
+        "importar",
+        help="preenche a base com os JSON já gerados (nome do arquivo = protocolo)"
+    )
+    importar.add_argument("pasta_json", type=Path, help="pasta com os JSON")
+
+    for pergunta in (item, itens, dimensoes):
+        pergunta.add_argument("--curso", help="nome do curso")
+        pergunta.add_argument("--campus", help="campus")
+        pergunta.add_argument("--ato", help="ato regulatório")
+        pergunta.add_argument("--de", type=int, dest="ano_de", help="a partir deste ano")
+        pergunta.add_argument("--ate", type=int, dest="ano_ate", help="até este ano")
+
+    return parser
+
+def _single(args: argparse.Namespace) -> None:
+    from .lote import processar_arquivo
+    from .motores import ExtratorTexto
+
+    _anunciar_motor(args)
+    processar_arquivo(
+        args.pdf,
+        args.json or args.pdf.with_suffix(".json"),
+        args.excel or args.pdf.with_suffix(".xlsx"),
+        excel_docentes=args.docentes,
+        leitura_seletiva=not args.todas_as_paginas,
+        motor=ExtratorTexto(args.motor, args.paginas_verificacao)
+    )
+
+def _batch(args: argparse.Namespace) -> None:
+    from .lote import processar_pasta_pdfs, vigiar_pasta_pdfs
+
+    base = args.pasta_pdfs.parent
+    pasta_json = args.json or base / "JSON"
+    pasta_excel = args.excel or base / "EXCEL"
+    pasta_cache = None if args.sem_cache else (args.cache or base / "CACHE")
+    json_por_protocolo = not args.ndjson or args.json_por_protocolo
+
+    if args.vetorizado and (args.vigiar or args.assincrono or args.workers > 1):
+        raise SystemExit("❌ --vetorizado roda num único processo: não combina com --vigiar, --assincrono nem --workers")
+
+    if args.pasta_local and not args.pre_leitura:
+        raise SystemExit("❌ --pasta-local só vale com --pre-leitura")
+    if args.pre_leitura and (args.vigiar or args.assincrono):
+        raise SystemExit("❌ --pre-leitura não combina com --vigiar nem --assincrono (que já lê os PDFs à frente, ver --fila-leitura)")
+
+    # o modo vigia grava JSON/Excel por protocolo, a base de consulta e o
+    # NDJSON; as demais opções do lote não têm efeito nele
+    if args.vigiar:
+        ignoradas = [
+            opcao
+            for opcao, valor in (
+                ("--consolidado", args.consolidado),
+                ("--exportar", args.exportar),
+                ("--log-execucao", args.log_execucao),
+                ("--reprocessar-desatualizados", args.reprocessar_desatualizados),
+                ("--reconstruir-indice", args.reconstruir_indice)
+            )
+            if valor
+        ]
+        if ignoradas:
+            raise SystemExit(f"❌ --vigiar não combina com {', '.join(ignoradas)}")
+
+    _anunciar_motor(args)
+
+    if args.vigiar:
+        vigiar_pasta_pdfs(
+            args.pasta_pdfs,
+            pasta_json,
+            pasta_excel,
+            workers=args.workers,
+            arquivos_por_worker=args.arquivos_por_worker,
+            paginas_sonda=args.paginas_sonda,
+            leitura_seletiva=not args.todas_as_paginas,
+            motor=args.motor,
+            paginas_verificacao=args.paginas_verificacao,
+            pasta_cache=pasta_cache,
+            cache_limite_mb=args.cache_limite_mb,
+            intervalo=args.intervalo,
+            estabilidade=args.estabilidade,
+            json_por_protocolo=json_por_protocolo,
+            base_consulta=args.base_consulta,
+            ndjson=args.ndjson
+        )
+        return
+
+    destino_exportacao = args.destino_exportacao
+    if args.exportar and not destino_exportacao:
+        destino_exportacao = (
+            base / "PARQUET"
+            if args.exportar == "parquet"
+            else base / "avaliacoes.csv.gz"
+        )
+
+    opcoes = {
+        "workers": args.workers,
+        "arquivos_por_worker": args.arquivos_por_worker,
+        "reconstruir_indice": args.reconstruir_indice,
+        "reprocessar_desatualizados": args.reprocessar_desatualizados,
+        "paginas_sonda": args.paginas_sonda,
+        "leitura_seletiva": not args.todas_as_paginas,
+        "motor": args.motor,
+        "paginas_verificacao": args.paginas_verificacao,
+        "pasta_cache": pasta_cache,
+        "cache_limite_mb": args.cache_limite_mb,
+        "consolidado": args.consolidado,
+        "consolidado_por_dimensao": args.por_dimensao,
+        "excel_por_protocolo": not args.consolidado or args.excel_por_protocolo,
+        "json_por_protocolo": json_por_protocolo,
+        "exportar": args.exportar,
+        "destino_exportacao": destino_exportacao,
+        "base_consulta": args.base_consulta,
+        "ndjson": args.ndjson,
+        "log_execucao": args.log_execucao
+    }
+
+    if args.assincrono:
+        from .assincrono import processar_pasta_assincrono
+
+        processar_pasta_assincrono(
+            args.pasta_pdfs,
+            pasta_json,
+            pasta_excel,
+            fila_leitura=args.fila_leitura,
+            fila_gravacao=args.fila_gravacao,
+            **opcoes
+        )
+    else:
+        processar_pasta_pdfs(
+            args.pasta_pdfs,
+            pasta_json,
+            pasta_excel,
+            bloco_vetorizado=args.vetorizado,
+            pre_leitura=args.pre_leitura,
+            pre_leitura_mb=args.pre_leitura_mb,
+            pasta_local=args.pasta_local,
+            **opcoes
+        )
+
+def _consulta(args: argparse.Namespace) -> None:
+    from .consulta import BaseConsulta, imprimir_tabela
+
+    if args.pergunta != "importar" and not args.base.exists():
+        raise SystemExit(f"❌ Base de consulta não encontrada: {args.base}")
+
+    base = BaseConsulta(args.base)
+    try:
+        if args.pergunta == "importar":
+            quantidade = base.importar_pasta_json(args.pasta_json)
+            print(f"✅ {quantidade} avaliações importadas de {args.pasta_json}")
+            return
+
+        filtros = {
+            "curso": args.curso,
+            "campus": args.campus,
+            "ato": args.ato,
+            "ano_de": args.ano_de,
+            "ano_ate": args.ano_ate
+        }
+        if args.pergunta == "item":
+            imprimir_tabela(base.evolucao_item(args.numero, **filtros))
+        elif args.pergunta == "itens":
+            imprimir_tabela(base.media_por_item(**filtros))
+        else:
+            imprimir_tabela(base.media_por_dimensao(**filtros))
+    finally:
+        base.conexao.close()
+
+def main(argv: list = None) -> None:
+    args = _parser().parse_args(argv)
+
+    if args.comando == "single":
+        _single(args)
+    elif args.comando == "batch":
+        _batch(args)
+    else:
+        _consulta(args)
@@ -0,0 +1,239 @@
+# Base de consulta entre anos (SQLite)
+#
+# Cada relatório processado entra numa base SQLite com índices por curso,
+# campus, ato regulatório, ano e número do item. Perguntas como "como o
+# item 2.3 deste curso variou de 2019 a 2024" ou "média da Nota por item"
+# viram uma consulta indexada, sem reabrir os JSON. A base é atualizada
+# em cada relatório concluído (reprocessar um protocolo substitui os itens
+# dele) e pode ser preenchida a partir de uma pasta de JSON já existente.
+#
+# Notas NSA (o "NSA" do relatório e a nota 6 dos itens sem justificativa)
+# ficam com nota nula e nsa = 1: entram na contagem de NSA, não na média.
+import re
+import json
+import sqlite3
+from pathlib import Path
+
+from .registros import DIMENSOES, AvaliacaoCurso, e_nsa
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS avaliacoes (
+    protocolo TEXT PRIMARY KEY,
+    curso TEXT NOT NULL,
+    campus TEXT NOT NULL,
+    ato TEXT NOT NULL,
+    ano INTEGER,
+    conceito_continuo REAL,
+    conceito_faixa INTEGER
+);
+CREATE INDEX IF NOT EXISTS avaliacoes_curso
+    ON avaliacoes (curso, campus, ato, ano);
+CREATE INDEX IF NOT EXISTS avaliacoes_ano ON avaliacoes (ano);
+
+CREATE TABLE IF NOT EXISTS itens (
+    protocolo TEXT NOT NULL REFERENCES avaliacoes (protocolo),
+    dimensao INTEGER NOT NULL,
+    numero TEXT NOT NULL,
+    ordem INTEGER NOT NULL,
+    titulo TEXT NOT NULL,
+    nota INTEGER,
+    nsa INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS itens_protocolo ON itens (protocolo);
+CREATE INDEX IF NOT EXISTS itens_numero ON itens (numero, protocolo);
+"""
+
+PADRAO_NUMERO = re.compile(r'(\d+)\.(\d+)\.')
+
+def _numero(texto: str):
+    texto = (texto or "").strip().replace(",", ".")
+    try:
+        return float(texto)
+    except ValueError:
+        return None
+
+class BaseConsulta:
+    def __init__(self, caminho: Path):
+        self.caminho = caminho
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+
+        # a gravação pode vir de outra thread (modo assíncrono, callback do
+        # modo vigia), mas sempre de uma de cada vez
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.execute("PRAGMA synchronous=NORMAL")
+        self.conexao.executescript(ESQUEMA)
+
+    # uma transação por relatório: a base nunca fica com um relatório pela metade
+    def adicionar(self, dados) -> None:
+        if not isinstance(dados, AvaliacaoCurso):
+            dados = AvaliacaoCurso.de_json(dados)
+        if not dados.protocolo:
+            raise ValueError("Avaliação sem protocolo não entra na base de consulta")
+
+        info = dados.info
+        ano = int(info.ano) if info.ano.isdigit() else None
+        faixa = _numero(info.conceito_faixa)
+
+        itens = []
+        for item in dados.itens:
+            m = PADRAO_NUMERO.match(item.titulo)
+            if not m:
+                continue
+            nsa = e_nsa(item.nota)
+            itens.append((
+                dados.protocolo,
+                item.dimensao,
+                f"{m.group(1)}.{m.group(2)}",
+                int(m.group(2)),
+                item.titulo,
+                None if nsa or item.nota < 0 else item.nota,
+                int(nsa)
+            ))
+
+        with self.conexao:
+            self.conexao.execute("DELETE FROM itens WHERE protocolo = ?", (dados.protocolo,))
+            self.conexao.execute(
+                "INSERT OR REPLACE INTO avaliacoes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    dados.protocolo,
+                    info.nome,
+                    info.campus,
+                    info.ato,
+                    ano,
+                    _numero(info.conceito_continuo),
+                    None if faixa is None else int(faixa)
+                )
+            )
+            self.conexao.executemany(
+                "INSERT INTO itens VALUES (?, ?, ?, ?, ?, ?, ?)",
+                itens
+            )
+
+    def importar_pasta_json(self, pasta_json: Path) -> int:
+        quantidade = 0
+        for arquivo in sorted(pasta_json.glob("*.json")):
+            with open(arquivo, encoding="utf-8") as f:
+                estrutura = json.load(f)
+            self.adicionar(
+                AvaliacaoCurso.de_json(estrutura)._replace(protocolo=arquivo.stem)
+            )
+            quantidade += 1
+        return quantidade
+
+    def fechar(self) -> None:
+        self.conexao.close()
+        print(f"✅ Base de consulta atualizada: {self.caminho}")
+
+    # CONSULTAS
+    # Filtros opcionais comuns: curso, campus, ato, ano_de, ano_ate.
+    # O NOCASE do SQLite só ignora maiúsculas em ASCII ("Ç" != "ç"), então o
+    # texto do filtro é comparado em Python com os valores distintos da
+    # coluna e a consulta usa os que batem (continua indexada).
+    def _valores(self, coluna: str, valor: str) -> list:
+        alvo = valor.strip().casefold()
+        return [
+            existente
+            for (existente,) in self.conexao.execute(f"SELECT DISTINCT {coluna} FROM avaliacoes")
+            if existente.casefold() == alvo
+        ]
+
+    def _filtros(
+        self,
+        curso: str = None,
+        campus: str = None,
+        ato: str = None,
+        ano_de: int = None,
+        ano_ate: int = None
+    ) -> tuple:
+        condicoes = []
+        parametros = []
+        for coluna, valor in (("curso", curso), ("campus", campus), ("ato", ato)):
+            if valor:
+                valores = self._valores(coluna, valor)
+                condicoes.append(f"a.{coluna} IN ({', '.join('?' * len(valores))})")
+                parametros.extend(valores)
+        if ano_de is not None:
+            condicoes.append("a.ano >= ?")
+            parametros.append(ano_de)
+        if ano_ate is not None:
+            condicoes.append("a.ano <= ?")
+            parametros.append(ano_ate)
+
+        where = " AND ".join(condicoes) if condicoes else "1"
+        return where, parametros
+
+    def _consultar(self, sql: str, parametros: list) -> list:
+        cursor = self.conexao.execute(sql, parametros)
+        colunas = [c[0] for c in cursor.description]
+        return [dict(zip(colunas, linha)) for linha in cursor]
+
+    # um item ao longo dos anos (uma linha por avaliação)
+    def evolucao_item(self, numero: str, **filtros) -> list:
+        where, parametros = self._filtros(**filtros)
+        return self._consultar(
+            f"""
+            SELECT a.ano, a.curso, a.campus, a.ato, a.protocolo,
+                   i.titulo, i.nota, i.nsa
+            FROM itens i JOIN avaliacoes a USING (protocolo)
+            WHERE i.numero = ? AND {where}
+            ORDER BY a.ano, a.curso, a.campus, a.protocolo
+            """,
+            [numero, *parametros]
+        )
+
+    # média da Nota e contagem de NSA por item, dentro de cada dimensão
+    def media_por_item(self, **filtros) -> list:
+        where, parametros = self._filtros(**filtros)
+        linhas = self._consultar(
+            f"""
+            SELECT i.dimensao, i.numero,
+                   ROUND(AVG(i.nota), 2) AS media,
+                   COUNT(i.nota) AS avaliados,
+                   SUM(i.nsa) AS nsa
+            FROM itens i JOIN avaliacoes a USING (protocolo)
+            WHERE {where}
+            GROUP BY i.dimensao, i.numero
+            ORDER BY i.dimensao, MIN(i.ordem)
+            """,
+            parametros
+        )
+        for linha in linhas:
+            linha["dimensao"] = DIMENSOES[linha["dimensao"]]
+        return linhas
+
+    def media_por_dimensao(self, **filtros) -> list:
+        where, parametros = self._filtros(**filtros)
+        linhas = self._consultar(
+            f"""
+            SELECT i.dimensao,
+                   ROUND(AVG(i.nota), 2) AS media,
+                   COUNT(i.nota) AS avaliados,
+                   SUM(i.nsa) AS nsa,
+                   COUNT(DISTINCT i.protocolo) AS avaliacoes
+            FROM itens i JOIN avaliacoes a USING (protocolo)
+            WHERE {where}
+            GROUP BY i.dimensao
+            ORDER BY i.dimensao
+            """,
+            parametros
+        )
+        for linha in linhas:
+            linha["dimensao"] = DIMENSOES[linha["dimensao"]]
+        return linhas
+
+def imprimir_tabela(linhas: list) -> None:
+    if not linhas:
+        print("⚠️ Nenhum resultado.")
+        return
+
+    colunas = list(linhas[0])
+    textos = [["" if l[c] is None else str(l[c]) for c in colunas] for l in linhas]
+    larguras = [
+        min(max(len(c), *(len(t[i]) for t in textos)), 48)
+        for i, c in enumerate(colunas)
+    ]
+
+    print("   ".join(c.ljust(w) for c, w in zip(colunas, larguras)))
+    for texto in textos:
+        print("   ".join(v[:w].ljust(w) for v, w in zip(texto, larguras)))
@@ -0,0 +1,139 @@
+# Pré-leitura dos PDFs (pastas de rede)
+#
+# Numa pasta de rede (SMB), cada abertura do PDF pelo pdfplumber ou pelo
+# pdfium faz muitas leituras pequenas com seek, e um mesmo PDF é aberto
+# várias vezes (sonda, texto, conferência do motor, docentes, hash). Aqui
+# uma thread lê cada PDF inteiro numa única leitura sequencial, à frente do
+# processamento, e todas as aberturas seguintes leem da memória:
+#   - sem pasta local, o conteúdo fica em bytes (o BytesIO do pdfplumber
+#     e o pdfium usam o mesmo buffer, sem cópia);
+#   - com pasta local, o PDF é copiado para ela (disco local) e mapeado em
+#     memória (mmap); com processos filhos, eles recebem o caminho da
+#     cópia, já que um mmap não passa entre processos.
+# Ficam prontos à frente no máximo `quantidade` PDFs, e os PDFs lidos e
+# ainda em uso somam no máximo `limite_mb` (um PDF maior que o limite
+# passa sozinho). Quem consome devolve cada PDF com liberar(), na ordem em
+# que os recebeu.
+import os
+import mmap
+import time
+import shutil
+import tempfile
+import threading
+from collections import deque
+from pathlib import Path
+
+class PreLeitura:
+    def __init__(
+        self,
+        pdfs: list,
+        quantidade: int = 4,
+        limite_mb: int = 256,
+        pasta_local: Path = None,
+        mapear: bool = True
+    ):
+        self.pdfs = list(pdfs)
+        self.quantidade = max(quantidade, 1)
+        self.limite = limite_mb * 1024 * 1024
+        self.mapear = mapear
+
+        self.pasta = None
+        if pasta_local:
+            pasta_local.mkdir(parents=True, exist_ok=True)
+            self.pasta = Path(tempfile.mkdtemp(prefix="emec-", dir=pasta_local))
+
+        self._prontos = deque()    # (pdf, conteúdo, tamanho, cópia local)
+        self._entregues = deque()  # (tamanho, cópia local) ainda em uso
+        self._bytes = 0
+        self._fim = False
+        self._parar = False
+        self._condicao = threading.Condition()
+
+        self._thread = threading.Thread(target=self._ler, daemon=True)
+        self._thread.start()
+
+    def _cabe(self, tamanho: int) -> bool:
+        if self._parar:
+            return True
+        if len(self._prontos) >= self.quantidade:
+            return False
+        return self._bytes == 0 or self._bytes + tamanho <= self.limite
+
+    def _carregar(self, pdf: Path, numero: int):
+        if not self.pasta:
+            return pdf.read_bytes(), None
+
+        local = self.pasta / f"{numero:06d}.pdf"
+        shutil.copyfile(pdf, local)
+        if not self.mapear:
+            return local, local
+
+        with open(local, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b"", local  # mmap não mapeia arquivo vazio
+            conteudo = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return conteudo, local
+
+    def _ler(self) -> None:
+        for numero, pdf in enumerate(self.pdfs):
+            try:
+                tamanho = pdf.stat().st_size
+            except OSError:
+                tamanho = 0
+
+            with self._condicao:
+                self._condicao.wait_for(lambda: self._cabe(tamanho))
+                if self._parar:
+                    break
+                self._bytes += tamanho
+
+            # falhou a leitura: segue sem conteúdo e o erro aparece quando o
+            # processamento tentar abrir o próprio arquivo
+            try:
+                conteudo, local = self._carregar(pdf, numero)
+            except OSError:
+                conteudo, local = None, None
+
+            with self._condicao:
+                self._prontos.append((pdf, conteudo, tamanho, local))
+                self._condicao.notify_all()
+
+        with self._condicao:
+            self._fim = True
+            self._condicao.notify_all()
+
+    # (pdf, conteúdo ou None, segundos esperando a leitura)
+    def __iter__(self):
+        while True:
+            inicio = time.perf_counter()
+            with self._condicao:
+                self._condicao.wait_for(lambda: self._prontos or self._fim)
+                if not self._prontos:
+                    return
+                pdf, conteudo, tamanho, local = self._prontos.popleft()
+                self._entregues.append((tamanho, local))
+                self._condicao.notify_all()
+            yield pdf, conteudo, time.perf_counter() - inicio
+
+    def liberar(self) -> None:
+        with self._condicao:
+            tamanho, local = self._entregues.popleft()
+            self._bytes -= tamanho
+            self._condicao.notify_all()
+
+        # o mmap continua válido enquanto alguém o usa (no Windows a remoção
+        # falha nesse caso, e a cópia sai no fechar())
+        if local:
+            try:
+                local.unlink()
+            except OSError:
+                pass
+
+    def fechar(self) -> None:
+        with self._condicao:
+            self._parar = True
+            self._condicao.notify_all()
+        self._thread.join()
+
+        if self.pasta:
+            shutil.rmtree(self.pasta, ignore_errors=True)
@@ -0,0 +1,351 @@
+# Extração dos campos do relatório a partir do texto já limpo
+import re
+
+from .texto import _ESPACOS, limpar_texto
+
+# 3. EXTRAIR TODOS OS ITENS (MESMO SEM JUSTIFICATIVA)
+PADRAO_ITEM = re.compile(
+    r'(\d+\.\d+)\.\s+([^.]+?\.)',
+    re.IGNORECASE
+)
+
+def titulos_itens(texto: str):
+    for num, titulo in PADRAO_ITEM.findall(texto):
+        yield f"{num}. {titulo.strip()}"
+
+def extrair_todos_itens(texto: str) -> dict:
+    itens = {}
+
+    for chave in titulos_itens(texto):
+        itens[chave] = {
+            "Nota": "",
+            "Justificativa": ""
+        }
+
+    return itens
+
+# 4. EXTRAÇÃO DE NOTA + JUSTIFICATIVA (QUANDO EXISTIR)
+# O texto é segmentado numa única passada pelos inícios de item
+# ("1.2. Título") e de dimensão ("Dimensão 2"); cada trecho entre dois
+# inícios consecutivos é analisado isoladamente, então a justificativa
+# de um item nunca é atribuída ao título de outro.
+PADRAO_INICIO_SEGMENTO = re.compile(
+    r'(?<!\S)(?:\d+\.\d+\.\s+[A-Z]|Dimensão\s+\d+)',
+    re.IGNORECASE
+)
+
+PADRAO_TITULO_ITEM = re.compile(
+    r'\d+\.\d+\.\s+[^.]+?\.',
+    re.IGNORECASE
+)
+
+PADRAO_CONCEITO = re.compile(
+    r'Justificativa\s+para\s+conceito\s+(?P<conceito>\d|NSA)\s*:',
+    re.IGNORECASE
+)
+
+def segmentar_itens(texto: str):
+    inicios = [m.start() for m in PADRAO_INICIO_SEGMENTO.finditer(texto)]
+    inicios.append(len(texto))
+
+    for inicio, fim in zip(inicios, inicios[1:]):
+        titulo = PADRAO_TITULO_ITEM.match(texto, inicio, fim)
+        if titulo:
+            yield titulo.group(), texto[titulo.end():fim]
+
+# limpeza da justificativa
+PADRAO_LIXO = re.compile(
+    r'(?:\d{1,2}/\d{1,2}/\d{2,4},?\s*\d{1,2}:\d{1,2}(?::\d{1,2})?\s*(?:AM|PM)?)' # Datas e Horas flexíveis
+    r'|(?:\d+\s+of\s+\d+)' # Paginação "1 of 10"
+    r'|Firefox|about:blank', # Marcas do navegador
+    re.IGNORECASE
+)
+
+def limpar_justificativa(justificativa: str) -> str:
+    justificativa = PADRAO_LIXO.sub(' ', justificativa)
+    return _ESPACOS.sub(' ', justificativa).strip()
+
+# (título, nota, justificativa ainda sem limpeza) de cada item avaliado
+def notas_justificativas_brutas(texto: str):
+    for titulo, corpo in segmentar_itens(texto):
+        m = PADRAO_CONCEITO.search(corpo)
+        if not m:
+            continue
+
+        yield titulo.strip(), m.group("conceito").strip(), corpo[m.end():]
+
+def extrair_notas_justificativas(texto: str) -> dict:
+    resultado = {}
+
+    for titulo, nota, justificativa in notas_justificativas_brutas(texto):
+        resultado[titulo] = {
+            "Nota": nota,
+            "Justificativa": limpar_justificativa(justificativa)
+        }
+
+    return resultado
+
+# DOCENTES
+# A seção fica entre o título "DOCENTES" e "CATEGORIAS AVALIADAS". As
+# páginas são localizadas no texto já extraído, e os docentes saem desse
+# mesmo texto; só quando ele falha as páginas são reabertas para a leitura
+# da tabela pelo pdfplumber.
+PADRAO_INICIO_DOCENTES = re.compile(r'\bDOCENTES\b')
+PADRAO_FIM_DOCENTES = re.compile(r'CATEGORIAS AVALIADAS', re.IGNORECASE)
+
+PADRAO_DOCENTE = re.compile(
+    r'(?P<nome>.*?)\s+'
+    r'(?P<titulacao>Doutorado|Mestrado|Especialização)\s+'
+    r'(?P<regime>Integral|Parcial|Horista)\s+'
+    r'(?P<vinculo>CLT|Outro)\s+'
+    r'(?P<meses>\d+)\s*Mês\(es\)',
+    re.IGNORECASE
+)
+
+PADRAO_FIM_REGISTRO = re.compile(r'\d+\s*Mês\(es\)', re.IGNORECASE)
+
+PADRAO_CABECALHO_DOCENTES = re.compile(
+    r'Nome do Docente.*?meses\)',
+    re.IGNORECASE | re.DOTALL
+)
+
+def localizar_paginas_docentes(paginas: list) -> list:
+    indices = []
+
+    for i, texto in enumerate(paginas):
+        if not indices:
+            if not PADRAO_INICIO_DOCENTES.search(texto):
+                continue
+            texto = texto[PADRAO_INICIO_DOCENTES.search(texto).end():]
+
+        indices.append(i)
+        if PADRAO_FIM_DOCENTES.search(texto):
+            break
+
+    return indices
+
+def _registros_da_tabela(pagina) -> list:
+    registros = []
+    for tabela in pagina.extract_tables():
+        for linha in tabela:
+            celulas = [re.sub(r'\s+', ' ', c or '').strip() for c in linha]
+            registros.append(" ".join(c for c in celulas if c))
+    return registros
+
+# trecho da página que pertence à seção (sem título, cabeçalho e o que
+# vem depois de "CATEGORIAS AVALIADAS")
+def _trecho_docentes(texto: str) -> str:
+    inicio = PADRAO_INICIO_DOCENTES.search(texto)
+    if inicio:
+        texto = texto[inicio.end():]
+
+    fim = PADRAO_FIM_DOCENTES.search(texto)
+    if fim:
+        texto = texto[:fim.start()]
+
+    return PADRAO_CABECALHO_DOCENTES.sub('', texto)
+
+# Texto das páginas da seção, juntas por "\n": cada docente termina na
+# linha com "Mês(es)", mesmo que comece na página anterior. Cabeçalho e
+# rodapé do navegador (about:blank, Firefox, "Página N de M", número da
+# página) saem linha a linha com a limpeza de sempre, antes da divisão.
+def _registros_do_texto(texto: str) -> list:
+    texto = _trecho_docentes(texto)
+    registros = []
+    atual = []
+    for linha in texto.split("\n"):
+        linha = limpar_texto(f"\n{linha}\n")
+        if not linha:
+            continue
+
+        atual.append(linha)
+        if PADRAO_FIM_REGISTRO.search(linha):
+            registros.append(" ".join(atual))
+            atual = []
+    return registros
+
+def extrair_protocolo(texto: str) -> str:
+    m = re.search(
+        r'Protocolo\s*:\s*(\d+)',
+        texto,
+        flags=re.IGNORECASE
+    )
+    return m.group(1) if m else ""
+
+# 5. INFORMAÇÕES DO CURSO
+# Nome, campus, ano e ato ficam no cabeçalho do relatório: um único padrão,
+# com um grupo por campo, percorre só o texto das páginas do cabeçalho e
+# para assim que todos aparecem. O CONCEITO FINAL é procurado só no trecho
+# da página da tabela; sem esse trecho, também no cabeçalho. As páginas do
+# cabeçalho e a do conceito saem das mesmas regras que a pré-classificação
+# usa para escolher as páginas lidas (ver classificacao.py):
+#   - cabeçalho: da primeira página até a última onde aparece um dos
+#     sinais abaixo, e pelo menos os primeiros MINIMO_CABECALHO caracteres
+#     (a busca por "(EAD)" olha o início do texto);
+#   - conceito: a primeira página com o CONCEITO FINAL a partir da primeira
+#     "Dimensão N" (sem dimensões, a primeira do relatório) e a seguinte.
+# Sem algum sinal obrigatório, o cabeçalho é o texto inteiro. Um campo fora
+# desses trechos não é procurado no resto do texto: fica vazio e aparece em
+# campos_ausentes().
+SINAIS_OBRIGATORIOS = [
+    re.compile(r'Protocolo\s*:\s*\d+', re.IGNORECASE),
+    re.compile(r'Curso\(s\)', re.IGNORECASE),
+    re.compile(r'Informações da comissão', re.IGNORECASE),
+]
+
+SINAIS_OPCIONAIS = [
+    re.compile(r'Endereço da IES', re.IGNORECASE),
+    re.compile(r'Data\s+de\s+\d{2}/\d{2}/\d{4}', re.IGNORECASE),
+    re.compile(r'Ato Regulatório\s*:', re.IGNORECASE),
+]
+
+PADRAO_DIMENSAO = re.compile(r'Dimensão\s+\d', re.IGNORECASE)
+
+MINIMO_CABECALHO = 3000  # caracteres
+JANELA_EAD = 1500        # a modalidade "(EAD)" vem logo no início
+
+def primeira_pagina(padrao: re.Pattern, paginas: list, inicio: int = 0) -> int:
+    for indice in range(inicio, len(paginas)):
+        if padrao.search(paginas[indice]):
+            return indice
+    return None
+
+# índice da última página do cabeçalho (None = falta um sinal obrigatório)
+def fim_cabecalho(paginas: list) -> int:
+    fim = 0
+    for padrao in SINAIS_OBRIGATORIOS:
+        indice = primeira_pagina(padrao, paginas)
+        if indice is None:
+            return None
+        fim = max(fim, indice)
+
+    for padrao in SINAIS_OPCIONAIS:
+        indice = primeira_pagina(padrao, paginas)
+        if indice is not None:
+            fim = max(fim, indice)
+
+    tamanho = sum(len(t) for t in paginas[:fim + 1])
+    while tamanho < MINIMO_CABECALHO and fim + 1 < len(paginas):
+        fim += 1
+        tamanho += len(paginas[fim])
+    return fim
+
+PADRAO_CABECALHO = re.compile(
+    # filtro pela primeira letra (o re testa cada alternativa em cada posição)
+    r'(?=[CEDA(])(?:'
+    # o nome fica num lookahead para não consumir os campos do meio do trecho
+    r'Curso\(s\)(?=.*?avaliado\(s\)\s*:\s*(?P<nome>.*?)\s*Informações da comissão)'
+    r'|Endereço da IES\s*:?\s*\d+\s*-\s*(?P<campus>UNASP campus [A-Za-zÀ-ÿ\s]+?)\s*-'
+    r'|Data\s+de\s+\d{2}/\d{2}/(?P<ano>\d{4})'
+    r'|Ato Regulatório\s*:\s*(?P<ato>Reconhecimento|Autorização)'
+    r'|(?P<ead>(?-i:\(EAD\)|\(EaD\)))'
+    r')',
+    re.IGNORECASE | re.DOTALL
+)
+
+PADRAO_CONCEITO_FINAL = re.compile(r'CONCEITO FINAL CONT[IÍ]NUO', re.IGNORECASE)
+
+PADRAO_VALORES_CONCEITO = re.compile(
+    r'CONCEITO FINAL CONT[IÍ]NUO\s*CONCEITO FINAL FAIXA\s*([\d,]+)\s*(\d)',
+    re.IGNORECASE
+)
+
+CAMPOS_OBRIGATORIOS = (
+    "Nome",
+    "Ano da avaliação",
+    "Ato Regulatório",
+    "CONCEITO FINAL CONTÍNUO"
+)
+
+# a tabela fecha a avaliação: a primeira depois do início das dimensões
+def localizar_pagina_conceito(paginas: list) -> int:
+    inicio = primeira_pagina(PADRAO_DIMENSAO, paginas) or 0
+    return primeira_pagina(PADRAO_CONCEITO_FINAL, paginas, inicio)
+
+# a tabela pode continuar na página seguinte: as duas são lidas (e mantidas
+# pela pré-classificação); vazio = sem a tabela
+def paginas_conceito(paginas: list) -> range:
+    pagina = localizar_pagina_conceito(paginas)
+    if pagina is None:
+        return range(0)
+    return range(pagina, min(pagina + 2, len(paginas)))
+
+# cabecalho: o texto (limpo) das páginas do cabeçalho, ou o texto inteiro
+def extrair_informacoes_curso(cabecalho: str, trecho_conceito: str = None) -> dict:
+    info = {
+        "Nome": "",
+        "Campus": "",
+        "Ano da avaliação": "",
+        "Ato Regulatório": "",
+        "CONCEITO FINAL CONTÍNUO": "",
+        "CONCEITO FINAL FAIXA": ""
+    }
+
+    # vale a primeira ocorrência de cada campo
+    campos = {}
+    for m in PADRAO_CABECALHO.finditer(cabecalho):
+        campo = m.lastgroup
+        if campo == "ead" and m.end() > JANELA_EAD:
+            continue
+        campos.setdefault(campo, m.group(campo))
+        if campos.keys() >= {"nome", "campus", "ano", "ato"}:
+            break
+
+    if "nome" in campos:
+        nome = re.sub(r'\s+', ' ', campos["nome"]).strip()
+
+        # remove apenas " I", " II", " III" no final
+        nome = re.sub(r'\s+\bI{1,3}\b$', '', nome)
+
+        info["Nome"] = nome
+
+    # modalidade, substituída pelo nome do campus físico quando houver
+    info["Campus"] = "EAD" if "ead" in campos else "Presencial"
+    if "campus" in campos:
+        info["Campus"] = campos["campus"].strip()
+
+    if "ano" in campos:
+        info["Ano da avaliação"] = campos["ano"]
+
+    if "ato" in campos:
+        info["Ato Regulatório"] = campos["ato"].capitalize()
+
+    m = PADRAO_VALORES_CONCEITO.search(
+        cabecalho if trecho_conceito is None else trecho_conceito
+    )
+    if m:
+        info["CONCEITO FINAL CONTÍNUO"] = m.group(1)
+        info["CONCEITO FINAL FAIXA"] = m.group(2)
+
+    return info
+
+def campos_ausentes(info: dict) -> list:
+    return [campo for campo in CAMPOS_OBRIGATORIOS if not info[campo]]
+
+# 6. ESTRUTURA BASE
+def criar_estrutura_base() -> dict:
+    return {
+        "Informações curso": {
+            "Nome": "",
+            "Campus": "",
+            "Ano da avaliação": "",
+            "Ato Regulatório": "",
+            "CONCEITO FINAL CONTÍNUO": "",
+            "CONCEITO FINAL FAIXA": ""
+        },
+        "Dimensões": {
+            "ORGANIZAÇÃO DIDÁTICO-PEDAGÓGICA": [],
+            "CORPO DOCENTE E TUTORIAL": [],
+            "INFRAESTRUTURA": []
+        }
+    }
+
+# 7. INSERÇÃO NAS DIMENSÕES
+def inserir_dados(estrutura: dict, itens: dict) -> None:
+    for titulo, dados in sorted(itens.items()):
+        if titulo.startswith("1."):
+            estrutura["Dimensões"]["ORGANIZAÇÃO DIDÁTICO-PEDAGÓGICA"].append({titulo: dados})
+        elif titulo.startswith("2."):
+            estrutura["Dimensões"]["CORPO DOCENTE E TUTORIAL"].append({titulo: dados})
+        elif titulo.startswith("3."):
+            estrutura["Dimensões"]["INFRAESTRUTURA"].append({titulo: dados})
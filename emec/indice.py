@@ -0,0 +1,122 @@
+# Índice dos protocolos já processados
+import os
+import json
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+from .texto import versao_pdfplumber
+
+# Índice de protocolos já processados (JSON-lines na pasta do Excel):
+# carregado uma vez, consulta exata em O(1) e uma linha por protocolo concluído
+ARQUIVO_INDICE = "protocolos_processados.jsonl"
+
+# Versão do extrator: hash do código dos módulos que decidem o conteúdo das
+# saídas (padrões de limpeza e de extração, seleção de páginas, montagem do
+# JSON e do Excel) e da versão do pdfplumber. Cada linha do índice guarda a
+# versão que gerou as saídas e o hash do PDF de origem; com
+# --reprocessar-desatualizados, só é refeito o protocolo cuja versão ou
+# PDF mudou. Qualquer alteração nesses arquivos conta como nova versão.
+MODULOS_EXTRATOR = (
+    "texto.py",
+    "classificacao.py",
+    "extracao.py",
+    "relatorio.py",
+    "registros.py",
+    "tabela.py",
+    "saidas.py"
+)
+
+@lru_cache(maxsize=None)
+def versao_extrator() -> str:
+    h = hashlib.sha256(versao_pdfplumber().encode())
+    pasta = Path(__file__).parent
+    for nome in MODULOS_EXTRATOR:
+        h.update(nome.encode())
+        h.update((pasta / nome).read_bytes())
+    return h.hexdigest()[:16]
+
+class IndiceProtocolos:
+    def __init__(self, pasta_excel: Path, reconstruir: bool = False):
+        self.caminho = pasta_excel / ARQUIVO_INDICE
+        self.registros = {}  # protocolo -> linha mais recente do índice
+
+        if reconstruir or not self.caminho.exists():
+            self.reconstruir(pasta_excel)
+        else:
+            self.carregar()
+
+    def carregar(self) -> None:
+        with open(self.caminho, encoding="utf-8") as f:
+            for linha in f:
+                linha = linha.strip()
+                if not linha:
+                    continue
+                try:
+                    registro = json.loads(linha)
+                    self.registros[registro["protocolo"]] = registro
+                except (ValueError, KeyError):
+                    # linha truncada por uma interrupção: ignora
+                    continue
+
+    # a partir dos .xlsx não há como saber a versão nem o PDF de origem:
+    # esses protocolos contam como desatualizados
+    def reconstruir(self, pasta_excel: Path) -> None:
+        self.registros = {
+            arquivo.stem: {"protocolo": arquivo.stem}
+            for arquivo in pasta_excel.glob("*.xlsx")
+            if arquivo.stem.isdigit()
+        }
+
+        # grava em arquivo temporário e troca de uma vez
+        temporario = self.caminho.with_suffix(".tmp")
+        with open(temporario, "w", encoding="utf-8") as f:
+            for protocolo in sorted(self.registros):
+                f.write(json.dumps(self.registros[protocolo]) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, self.caminho)
+
+    def __contains__(self, protocolo: str) -> bool:
+        return protocolo in self.registros
+
+    def atualizado(self, protocolo: str, origem: str) -> bool:
+        registro = self.registros.get(protocolo)
+        return (
+            registro is not None
+            and registro.get("versao") == versao_extrator()
+            and registro.get("origem") == origem
+        )
+
+    def registrar(self, protocolo: str, origem: str = "") -> None:
+        registro = {
+            "protocolo": protocolo,
+            "versao": versao_extrator(),
+            "origem": origem
+        }
+        if self.registros.get(protocolo) == registro:
+            return
+
+        # uma única escrita em modo append: a linha entra inteira ou não entra;
+        # ao carregar, a última linha de cada protocolo prevalece
+        linha = json.dumps(registro) + "\n"
+        with open(self.caminho, "a", encoding="utf-8") as f:
+            f.write(linha)
+            f.flush()
+            os.fsync(f.fileno())
+        self.registros[protocolo] = registro
+
+# origem: hash do PDF (ver texto.hash_pdf). Sem ela, basta o protocolo
+# estar no índice; com ela (--reprocessar-desatualizados), o registro
+# precisa ser da versão atual do extrator e do mesmo PDF.
+def protocolo_ja_processado(
+    protocolo: str,
+    indice: IndiceProtocolos,
+    origem: str = None
+) -> bool:
+    if not protocolo:
+        return False
+
+    if origem is None:
+        return protocolo in indice
+    return indice.atualizado(protocolo, origem)
@@ -0,0 +1,944 @@
+# Processamento de um PDF, de uma pasta inteira e do modo vigia
+import io
+import sys
+import time
+import queue
+import signal
+import multiprocessing
+from collections import Counter
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from .texto import CacheTextos, hash_pdf
+from .relatorio import (
+    RelatorioPDF,
+    extrair_docentes,
+    gravar_json,
+    ler_relatorio,
+    montar_avaliacao,
+    pdf_para_json,
+    sondar_protocolo
+)
+from .indice import IndiceProtocolos, protocolo_ja_processado
+from .saidas import (
+    ArquivoNDJSON,
+    PlanilhaConsolidada,
+    criar_exportador,
+    docentes_para_excel,
+    json_para_excel
+)
+from .registros import AvaliacaoCurso, como_avaliacao
+from .motores import (
+    MOTOR_PADRAO,
+    MOTOR_RECUO,
+    ExtratorTexto,
+    imprimir_uso_motores
+)
+from .consulta import BaseConsulta
+from .entrada import PreLeitura
+from .tabela import TAMANHO_BLOCO, montar_avaliacoes
+from .medicao import SEM_MEDICAO, MedicaoPDF, RelatorioExecucao
+
+# 10. PROCESSAR UM PDF
+# Em duas partes: analisar_pdf lê e extrai (CPU) sem gravar nada;
+# gravar_resultado escreve JSON, Excel e o índice (E/S). processar_pdf
+# chama as duas em sequência; com processos (pool, vigia e assíncrono), a
+# análise roda nos workers e a gravação no processo principal.
+# A análise, por sua vez, é ler_para_analise (leitura e pulos) + montagem
+# da avaliação + concluir_analise (docentes); o modo vetorizado monta as
+# avaliações de um bloco de PDFs de uma vez, entre as duas.
+@dataclass
+class ResultadoPDF:
+    pdf: Path
+    protocolo: str
+    dados: AvaliacaoCurso
+    docentes: list = field(default_factory=list)
+    hash_origem: str = ""  # sha256 do PDF, registrado no índice
+
+@dataclass
+class LeituraPDF:
+    pdf: Path
+    origem: object  # o caminho ou o conteúdo já lido
+    relatorio: RelatorioPDF
+    protocolo: str
+    hash_origem: str = None    # para comparar com o índice (None = não compara)
+    hash_conteudo: str = None  # já calculado (ver _soltar_conteudo)
+
+# O modo vetorizado guarda a leitura até o bloco ser gravado. Com a
+# pré-leitura, o conteúdo do PDF em memória seguiria preso no relatório
+# (e na origem) depois de devolvido à pré-leitura, fora do limite de MB:
+# o hash sai dele agora e os dois passam a apontar para o arquivo (que só
+# é reaberto se os docentes precisarem da tabela).
+def _soltar_conteudo(leitura: LeituraPDF) -> LeituraPDF:
+    if leitura.origem is leitura.pdf:
+        return leitura
+
+    hash_conteudo = leitura.hash_origem or hash_pdf(leitura.origem)
+    leitura.relatorio.caminho = leitura.pdf
+    return replace(leitura, origem=leitura.pdf, hash_conteudo=hash_conteudo)
+
+def ler_para_analise(
+    pdf: Path,
+    pasta_saida_excel: Path,
+    indice: IndiceProtocolos,
+    paginas_sonda: int = 1,
+    cache: CacheTextos = None,
+    excel_por_protocolo: bool = True,
+    medicao: MedicaoPDF = SEM_MEDICAO,
+    conteudo=None,
+    leitura_seletiva: bool = True,
+    motor: ExtratorTexto = None,
+    reprocessar_desatualizados: bool = False
+) -> LeituraPDF:
+    print(f"📄 Analisando: {pdf.name}")
+
+    # conteúdo já em memória (modo assíncrono, pré-leitura) ou o próprio arquivo
+    origem = pdf if conteudo is None else conteudo
+
+    # só se compara com o índice quando o modo pede; senão o hash é
+    # calculado no fim, só para os PDFs que serão gravados
+    hash_origem = hash_pdf(origem) if reprocessar_desatualizados else None
+
+    # 🔥 leitura mínima (só as primeiras páginas) para pegar o protocolo
+    with medicao.etapa("sonda"):
+        protocolo = sondar_protocolo(
+            origem,
+            paginas_sonda,
+            cache,
+            leitura_seletiva,
+            motor
+        )
+
+    if protocolo_ja_processado(protocolo, indice, hash_origem):
+        print(f"⏭️ Protocolo {protocolo} já processado. Pulando...")
+        medicao.anotar(protocolo=protocolo)
+        medicao.concluir("pulado: índice")
+        return None
+
+    # leitura única: protocolo, JSON e docentes usam o mesmo texto
+    acertos = cache.acertos if cache else 0
+    recuos = motor.recuos if motor else 0
+    with medicao.etapa("leitura_pdf"):
+        relatorio = ler_relatorio(origem, cache, leitura_seletiva, motor)
+    em_cache = cache and cache.acertos > acertos
+    if cache:
+        medicao.anotar(cache="acerto" if em_cache else "falha")
+    if motor and not em_cache:
+        medicao.anotar(motor=motor.nome if motor.recuos == recuos else MOTOR_RECUO)
+    medicao.anotar(paginas=len(relatorio.paginas))
+
+    # vale o protocolo do texto completo (conferido); o da sonda só fica
+    # quando o texto completo não tem nenhum
+    protocolo = relatorio.protocolo or protocolo
+    medicao.anotar(protocolo=protocolo)
+
+    if protocolo_ja_processado(protocolo, indice, hash_origem):
+        print(f"⏭️ Protocolo {protocolo} já processado. Pulando...")
+        medicao.concluir("pulado: índice")
+        return None
+
+    print(f"📄 Processando: {pdf.name}")
+
+    if not protocolo:
+        print(f"⚠️ Protocolo não encontrado em {pdf.name}")
+        medicao.concluir("sem protocolo")
+        return None
+
+    excel_saida = pasta_saida_excel / f"{protocolo}.xlsx"
+    excel_docentes = pasta_saida_excel / f"{protocolo}_docentes.xlsx"
+
+    # se já existe, pula (a não ser que o índice o tenha dado por desatualizado)
+    if (
+        excel_por_protocolo
+        and not reprocessar_desatualizados
+        and excel_saida.exists()
+        and excel_docentes.exists()
+    ):
+        print(f"⏭️ Protocolo {protocolo} já processado. Pulando.")
+        medicao.concluir("pulado: excel existente")
+        return None
+
+    return LeituraPDF(pdf, origem, relatorio, protocolo, hash_origem)
+
+def concluir_analise(
+    leitura: LeituraPDF,
+    dados: AvaliacaoCurso,
+    excel_por_protocolo: bool = True,
+    medicao: MedicaoPDF = SEM_MEDICAO
+) -> ResultadoPDF:
+    medicao.anotar(itens=len(dados.itens))
+
+    # txt_debug = pasta_saida_excel / f"{nome_base}_debug.txt"
+    # salvar_txt_debug(relatorio.texto_bruto, txt_debug)
+
+    docentes = []
+    if excel_por_protocolo:
+        with medicao.etapa("docentes"):
+            docentes = extrair_docentes(
+                leitura.relatorio,
+                dados.info.ato,
+                dados.info.para_dict()
+            )
+        medicao.anotar(docentes=len(docentes))
+
+    hash_origem = leitura.hash_origem or leitura.hash_conteudo
+    if hash_origem is None:
+        hash_origem = hash_pdf(leitura.origem)
+
+    return ResultadoPDF(leitura.pdf, leitura.protocolo, dados, docentes, hash_origem)
+
+def analisar_pdf(
+    pdf: Path,
+    pasta_saida_excel: Path,
+    indice: IndiceProtocolos,
+    paginas_sonda: int = 1,
+    cache: CacheTextos = None,
+    excel_por_protocolo: bool = True,
+    medicao: MedicaoPDF = SEM_MEDICAO,
+    conteudo=None,
+    leitura_seletiva: bool = True,
+    motor: ExtratorTexto = None,
+    reprocessar_desatualizados: bool = False
+) -> ResultadoPDF:
+    leitura = ler_para_analise(
+        pdf,
+        pasta_saida_excel,
+        indice,
+        paginas_sonda=paginas_sonda,
+        cache=cache,
+        excel_por_protocolo=excel_por_protocolo,
+        medicao=medicao,
+        conteudo=conteudo,
+        leitura_seletiva=leitura_seletiva,
+        motor=motor,
+        reprocessar_desatualizados=reprocessar_desatualizados
+    )
+    if not leitura:
+        return None
+
+    with medicao.etapa("extracao_json"):
+        dados = montar_avaliacao(leitura.relatorio)
+
+    return concluir_analise(leitura, dados, excel_por_protocolo, medicao)
+
+def gravar_resultado(
+    resultado: ResultadoPDF,
+    pasta_saida_json: Path,
+    pasta_saida_excel: Path,
+    indice: IndiceProtocolos,
+    excel_por_protocolo: bool = True,
+    medicao: MedicaoPDF = SEM_MEDICAO,
+    json_por_protocolo: bool = True
+) -> None:
+    protocolo = resultado.protocolo
+
+    with medicao.etapa("gravacao"):
+        if json_por_protocolo:
+            gravar_json(
+                resultado.dados.para_json(),
+                pasta_saida_json / f"{protocolo}.json"
+            )
+
+        if excel_por_protocolo:
+            json_para_excel(
+                resultado.dados,
+                pasta_saida_excel / f"{protocolo}.xlsx"
+            )
+            docentes_para_excel(
+                resultado.docentes,
+                pasta_saida_excel / f"{protocolo}_docentes.xlsx"
+            )
+
+    indice.registrar(protocolo, resultado.hash_origem)
+    medicao.concluir("processado")
+
+def _registrar_erro(pdf: Path, erro: Exception, medicao: MedicaoPDF) -> None:
+    print(f"❌ Erro ao processar {pdf.name}: {erro}")
+    medicao.anotar(erro=f"{type(erro).__name__}: {erro}")
+    medicao.concluir("erro")
+
+def processar_pdf(
+    pdf: Path,
+    pasta_saida_json: Path,
+    pasta_saida_excel: Path,
+    indice: IndiceProtocolos,
+    paginas_sonda: int = 1,
+    cache: CacheTextos = None,
+    excel_por_protocolo: bool = True,
+    medicao: MedicaoPDF = SEM_MEDICAO,
+    leitura_seletiva: bool = True,
+    json_por_protocolo: bool = True,
+    motor: ExtratorTexto = None,
+    reprocessar_desatualizados: bool = False,
+    conteudo=None
+) -> AvaliacaoCurso:
+    try:
+        resultado = analisar_pdf(
+            pdf,
+            pasta_saida_excel,
+            indice,
+            paginas_sonda=paginas_sonda,
+            cache=cache,
+            excel_por_protocolo=excel_por_protocolo,
+            medicao=medicao,
+            conteudo=conteudo,
+            leitura_seletiva=leitura_seletiva,
+            motor=motor,
+            reprocessar_desatualizados=reprocessar_desatualizados
+        )
+        if not resultado:
+            return None
+
+        gravar_resultado(
+            resultado,
+            pasta_saida_json,
+            pasta_saida_excel,
+            indice,
+            excel_por_protocolo=excel_por_protocolo,
+            medicao=medicao,
+            json_por_protocolo=json_por_protocolo
+        )
+        return resultado.dados
+
+    except Exception as e:
+        _registrar_erro(pdf, e, medicao)
+        return None
+
+# cada processo filho carrega o índice, o cache e o motor de extração uma
+# única vez ao iniciar
+_indice_worker = None
+_cache_worker = None
+_motor_worker = None
+
+def _iniciar_worker(
+    pasta_saida_excel: Path,
+    pasta_cache: Path,
+    cache_limite_mb: int,
+    motor: str = MOTOR_PADRAO,
+    paginas_verificacao: int = 1
+) -> None:
+    global _indice_worker, _cache_worker, _motor_worker
+
+    # Ctrl+C é tratado só pelo processo principal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _indice_worker = IndiceProtocolos(pasta_saida_excel)
+    if pasta_cache:
+        _cache_worker = CacheTextos(pasta_cache, cache_limite_mb)
+    _motor_worker = ExtratorTexto(motor, paginas_verificacao)
+
+# No processo filho só roda a análise: a saída é capturada e devolvida ao
+# pai junto com o resultado, a medição (que vai e volta) e o motor usado
+# no PDF (a contagem do worker se perde quando ele é reciclado); a gravação
+# fica com o processo principal, que imprime tudo na ordem dos arquivos.
+def _analisar_pdf_worker(args: tuple) -> tuple:
+    pdf, conteudo, opcoes, medicao = args
+    usos = _motor_worker.usos.copy()
+
+    saida = io.StringIO()
+    with redirect_stdout(saida):
+        try:
+            resultado = analisar_pdf(
+                pdf,
+                indice=_indice_worker,
+                cache=_cache_worker,
+                motor=_motor_worker,
+                medicao=medicao,
+                conteudo=conteudo,
+                **opcoes
+            )
+        except Exception as e:
+            _registrar_erro(pdf, e, medicao)
+            resultado = None
+    return saida.getvalue(), resultado, medicao, _motor_worker.usos - usos
+
+# Cada worker tem o seu índice, carregado ao iniciar, e não enxerga o que os
+# outros registram: o mesmo relatório com outro nome seria gravado uma vez
+# por worker. A conferência final é no índice do processo principal, que é
+# quem grava (modos pool, vigia e assíncrono). Devolve se gravou.
+def _gravar_no_principal(
+    resultado: ResultadoPDF,
+    indice: IndiceProtocolos,
+    opcoes: dict,
+    medicao: MedicaoPDF = SEM_MEDICAO,
+    reprocessar_desatualizados: bool = False
+) -> bool:
+    if protocolo_ja_processado(
+        resultado.protocolo,
+        indice,
+        resultado.hash_origem if reprocessar_desatualizados else None
+    ):
+        print(f"⏭️ Protocolo {resultado.protocolo} já processado. Pulando...")
+        medicao.concluir("pulado: índice")
+        return False
+
+    try:
+        gravar_resultado(resultado, indice=indice, medicao=medicao, **opcoes)
+    except Exception as e:
+        _registrar_erro(resultado.pdf, e, medicao)
+        return False
+    return True
+
+# saídas agregadas do lote: recebem os dados de cada PDF concluído.
+# substituir: num reprocessamento, as saídas acrescentadas trocam as linhas
+# antigas de cada protocolo refeito pelas novas (a base de consulta já faz
+# isso sempre)
+def abrir_saidas(
+    consolidado: Path = None,
+    consolidado_por_dimensao: bool = False,
+    exportar: str = None,
+    destino_exportacao: Path = None,
+    base_consulta: Path = None,
+    ndjson: Path = None,
+    substituir: bool = False
+) -> list:
+    saidas = []
+    if consolidado:
+        saidas.append(PlanilhaConsolidada(
+            consolidado,
+            consolidado_por_dimensao,
+            substituir=substituir
+        ))
+    if exportar:
+        saidas.append(criar_exportador(exportar, destino_exportacao, substituir))
+    if base_consulta:
+        saidas.append(BaseConsulta(base_consulta))
+    if ndjson:
+        saidas.append(ArquivoNDJSON(ndjson, substituir=substituir))
+    return saidas
+
+# PÓS-PROCESSAMENTO VETORIZADO (num único processo)
+# Os PDFs são lidos um a um (num reprocessamento, o texto vem do cache) e,
+# a cada `tamanho_bloco` relatórios, as avaliações do bloco são montadas
+# numa única tabela (ver tabela.py) e gravadas. A montagem do bloco é
+# dividida igualmente entre os PDFs na medição, e o tempo em que cada um
+# esperou o bloco encher não conta no total dele.
+def _concluir_bloco(
+    bloco: list,
+    pasta_saida_json: Path,
+    pasta_saida_excel: Path,
+    indice: IndiceProtocolos,
+    saidas: list,
+    execucao: RelatorioExecucao,
+    excel_por_protocolo: bool = True,
+    json_por_protocolo: bool = True
+) -> None:
+    inicio = time.perf_counter()
+    try:
+        avaliacoes = montar_avaliacoes([leitura.relatorio for leitura, _, _ in bloco])
+    except Exception:
+        # um relatório do bloco falhou: monta um a um, para o erro ficar no PDF certo
+        avaliacoes = None
+    parte = (time.perf_counter() - inicio) / len(bloco)
+
+    for posicao, (leitura, medicao, lido_em) in enumerate(bloco):
+        espera = time.perf_counter() - lido_em
+        if avaliacoes is not None:
+            espera -= parte
+        medicao.descontar(espera)
+        try:
+            if avaliacoes is None:
+                with medicao.etapa("extracao_json"):
+                    dados = montar_avaliacao(leitura.relatorio)
+            else:
+                medicao.somar_etapa("extracao_json", parte)
+                dados = avaliacoes[posicao]
+
+            # outro PDF do mesmo bloco pode já ter gravado este protocolo
+            if protocolo_ja_processado(leitura.protocolo, indice, leitura.hash_origem):
+                print(f"⏭️ Protocolo {leitura.protocolo} já processado. Pulando...")
+                medicao.concluir("pulado: índice")
+            else:
+                resultado = concluir_analise(leitura, dados, excel_por_protocolo, medicao)
+                gravar_resultado(
+                    resultado,
+                    pasta_saida_json,
+                    pasta_saida_excel,
+                    indice,
+                    excel_por_protocolo=excel_por_protocolo,
+                    medicao=medicao,
+                    json_por_protocolo=json_por_protocolo
+                )
+                for destino in saidas:
+                    destino.adicionar(dados)
+        except Exception as e:
+            _registrar_erro(leitura.pdf, e, medicao)
+
+        if execucao:
+            execucao.adicionar(medicao.registro)
+
+def _processar_em_blocos(
+    entradas,
+    indice: IndiceProtocolos,
+    cache: CacheTextos,
+    extrator: ExtratorTexto,
+    saidas: list,
+    execucao: RelatorioExecucao,
+    pasta_saida_json: Path,
+    pasta_saida_excel: Path,
+    tamanho_bloco: int = TAMANHO_BLOCO,
+    paginas_sonda: int = 1,
+    leitura_seletiva: bool = True,
+    excel_por_protocolo: bool = True,
+    json_por_protocolo: bool = True,
+    reprocessar_desatualizados: bool = False
+) -> None:
+    bloco = []
+
+    def concluir() -> None:
+        _concluir_bloco(
+            bloco,
+            pasta_saida_json,
+            pasta_saida_excel,
+            indice,
+            saidas,
+            execucao,
+            excel_por_protocolo,
+            json_por_protocolo
+        )
+        bloco.clear()
+
+    for pdf, conteudo, espera in entradas:
+        medicao = MedicaoPDF(pdf) if execucao else SEM_MEDICAO
+        if espera:
+            medicao.somar_etapa("leitura_arquivo", espera)
+        try:
+            leitura = ler_para_analise(
+                pdf,
+                pasta_saida_excel,
+                indice,
+                paginas_sonda=paginas_sonda,
+                cache=cache,
+                excel_por_protocolo=excel_por_protocolo,
+                medicao=medicao,
+                conteudo=conteudo,
+                leitura_seletiva=leitura_seletiva,
+                motor=extrator,
+                reprocessar_desatualizados=reprocessar_desatualizados
+            )
+            if leitura:
+                leitura = _soltar_conteudo(leitura)
+        except Exception as e:
+            _registrar_erro(pdf, e, medicao)
+            leitura = None
+        finally:
+            conteudo = None
+            entradas.liberar()
+
+        if not leitura:
+            if execucao:
+                execucao.adicionar(medicao.registro)
+            continue
+
+        bloco.append((leitura, medicao, time.perf_counter()))
+        if len(bloco) >= tamanho_bloco:
+            concluir()
+
+    if bloco:
+        concluir()
+
+# sem pré-leitura: cada PDF é aberto direto do arquivo
+class _SemPreLeitura:
+    def __init__(self, pdfs: list):
+        self.pdfs = pdfs
+
+    def __iter__(self):
+        for pdf in self.pdfs:
+            yield pdf, None, 0.0
+
+    def liberar(self) -> None:
+        pass
+
+    def fechar(self) -> None:
+        pass
+
+# 11. PROCESSAR PASTA DE PDFs
+def processar_pasta_pdfs(
+    pasta_pdfs: Path,
+    pasta_saida_json: Path,
+    pasta_saida_excel: Path,
+    workers: int = 1,
+    arquivos_por_worker: int = 50,
+    reconstruir_indice: bool = False,
+    reprocessar_desatualizados: bool = False,
+    paginas_sonda: int = 1,
+    leitura_seletiva: bool = True,
+    motor: str = MOTOR_PADRAO,
+    paginas_verificacao: int = 1,
+    pasta_cache: Path = None,
+    cache_limite_mb: int = 1024,
+    consolidado: Path = None,
+    consolidado_por_dimensao: bool = False,
+    excel_por_protocolo: bool = True,
+    json_por_protocolo: bool = True,
+    exportar: str = None,
+    destino_exportacao: Path = None,
+    base_consulta: Path = None,
+    ndjson: Path = None,
+    log_execucao: Path = None,
+    bloco_vetorizado: int = 0,
+    pre_leitura: int = 0,
+    pre_leitura_mb: int = 256,
+    pasta_local: Path = None
+) -> None:
+    pasta_saida_json.mkdir(parents=True, exist_ok=True)
+    pasta_saida_excel.mkdir(parents=True, exist_ok=True)
+
+    indice = IndiceProtocolos(pasta_saida_excel, reconstruir=reconstruir_indice)
+    cache = CacheTextos(pasta_cache, cache_limite_mb) if pasta_cache else None
+    extrator = ExtratorTexto(motor, paginas_verificacao)
+
+    pdfs = sorted(pasta_pdfs.glob("*.pdf"))
+
+    if not pdfs:
+        print("⚠️ Nenhum PDF encontrado na pasta.")
+        return
+
+    saidas = abrir_saidas(
+        consolidado,
+        consolidado_por_dimensao,
+        exportar,
+        destino_exportacao,
+        base_consulta,
+        ndjson,
+        substituir=reprocessar_desatualizados
+    )
+    execucao = RelatorioExecucao(log_execucao) if log_execucao else None
+
+    opcoes_analise = {
+        "pasta_saida_excel": pasta_saida_excel,
+        "paginas_sonda": paginas_sonda,
+        "leitura_seletiva": leitura_seletiva,
+        "excel_por_protocolo": excel_por_protocolo,
+        "reprocessar_desatualizados": reprocessar_desatualizados
+    }
+    opcoes_gravacao = {
+        "pasta_saida_json": pasta_saida_json,
+        "pasta_saida_excel": pasta_saida_excel,
+        "excel_por_protocolo": excel_por_protocolo,
+        "json_por_protocolo": json_por_protocolo
+    }
+    opcoes = {**opcoes_analise, **opcoes_gravacao}
+
+    # processos filhos recebem bytes ou o caminho da cópia local, nunca um mmap
+    if pre_leitura:
+        entradas = PreLeitura(
+            pdfs,
+            pre_leitura,
+            pre_leitura_mb,
+            pasta_local,
+            mapear=workers <= 1 or bool(bloco_vetorizado)
+        )
+    else:
+        entradas = _SemPreLeitura(pdfs)
+
+    try:
+        if bloco_vetorizado:
+            _processar_em_blocos(
+                entradas,
+                indice,
+                cache,
+                extrator,
+                saidas,
+                execucao,
+                tamanho_bloco=bloco_vetorizado,
+                **opcoes
+            )
+            return
+
+        if workers <= 1:
+            for pdf, conteudo, espera in entradas:
+                medicao = MedicaoPDF(pdf) if execucao else SEM_MEDICAO
+                if espera:
+                    medicao.somar_etapa("leitura_arquivo", espera)
+                dados = processar_pdf(
+                    pdf,
+                    indice=indice,
+                    cache=cache,
+                    medicao=medicao,
+                    motor=extrator,
+                    conteudo=conteudo,
+                    **opcoes
+                )
+                entradas.liberar()
+                if execucao:
+                    execucao.adicionar(medicao.registro)
+                if dados:
+                    for destino in saidas:
+                        destino.adicionar(dados)
+            return
+
+        # workers são reciclados a cada N arquivos para limitar a memória.
+        # O pool consome as tarefas numa thread própria, à medida que a
+        # pré-leitura as libera.
+        tarefas = (
+            (
+                pdf,
+                conteudo,
+                opcoes_analise,
+                MedicaoPDF(pdf) if execucao else SEM_MEDICAO
+            )
+            for pdf, conteudo, _ in entradas
+        )
+        with multiprocessing.Pool(
+            processes=workers,
+            maxtasksperchild=arquivos_por_worker or None,
+            initializer=_iniciar_worker,
+            initargs=(
+                pasta_saida_excel,
+                pasta_cache,
+                cache_limite_mb,
+                motor,
+                paginas_verificacao
+            )
+        ) as pool:
+            try:
+                for saida, resultado, medicao, usos in pool.imap(
+                    _analisar_pdf_worker,
+                    tarefas
+                ):
+                    entradas.liberar()
+                    print(saida, end="")
+                    extrator.usos.update(usos)
+                    if resultado and _gravar_no_principal(
+                        resultado,
+                        indice,
+                        opcoes_gravacao,
+                        medicao,
+                        reprocessar_desatualizados
+                    ):
+                        for destino in saidas:
+                            destino.adicionar(resultado.dados)
+                    if execucao:
+                        execucao.adicionar(medicao.registro)
+            finally:
+                # antes de encerrar o pool, que espera a thread das tarefas
+                entradas.fechar()
+    finally:
+        entradas.fechar()
+        for destino in saidas:
+            destino.fechar()
+        if execucao:
+            execucao.fechar()
+        imprimir_uso_motores(extrator.usos)
+
+# 12. MODO VIGIA: PROCESSA OS PDFs À MEDIDA QUE CHEGAM
+# Usa inotify (via watchdog, se instalado) e, sem ele, varre a listagem da
+# pasta a cada intervalo. Um arquivo só entra na fila depois de ficar
+# `estabilidade` segundos com o mesmo tamanho e mtime (cópia concluída).
+def _assinatura(caminho: Path) -> tuple:
+    st = caminho.stat()
+    return st.st_size, st.st_mtime_ns
+
+def _iniciar_observador(pasta_pdfs: Path, eventos: queue.Queue):
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class _Avisador(FileSystemEventHandler):
+        def on_any_event(self, evento):
+            if evento.is_directory:
+                return
+            destino = getattr(evento, "dest_path", "") or evento.src_path
+            if str(destino).endswith(".pdf"):
+                eventos.put(Path(destino))
+
+    observador = Observer()
+    observador.schedule(_Avisador(), str(pasta_pdfs), recursive=False)
+    observador.start()
+    return observador
+
+def vigiar_pasta_pdfs(
+    pasta_pdfs: Path,
+    pasta_saida_json: Path,
+    pasta_saida_excel: Path,
+    workers: int = 1,
+    arquivos_por_worker: int = 50,
+    paginas_sonda: int = 1,
+    leitura_seletiva: bool = True,
+    motor: str = MOTOR_PADRAO,
+    paginas_verificacao: int = 1,
+    pasta_cache: Path = None,
+    cache_limite_mb: int = 1024,
+    intervalo: float = 1.0,
+    estabilidade: float = 2.0,
+    json_por_protocolo: bool = True,
+    base_consulta: Path = None,
+    ndjson: Path = None
+) -> None:
+    pasta_pdfs.mkdir(parents=True, exist_ok=True)
+    pasta_saida_json.mkdir(parents=True, exist_ok=True)
+    pasta_saida_excel.mkdir(parents=True, exist_ok=True)
+
+    # garante o índice em disco antes de os workers o carregarem; o dos
+    # workers só é recarregado quando eles são reciclados, o do processo
+    # principal é o que vale para gravar
+    indice = IndiceProtocolos(pasta_saida_excel)
+
+    opcoes_analise = {
+        "pasta_saida_excel": pasta_saida_excel,
+        "paginas_sonda": paginas_sonda,
+        "leitura_seletiva": leitura_seletiva
+    }
+    opcoes_gravacao = {
+        "pasta_saida_json": pasta_saida_json,
+        "pasta_saida_excel": pasta_saida_excel,
+        "json_por_protocolo": json_por_protocolo
+    }
+
+    eventos = queue.Queue()
+    observador = _iniciar_observador(pasta_pdfs, eventos)
+
+    if observador:
+        print(f"👀 Vigiando {pasta_pdfs} (inotify)")
+    else:
+        print(f"👀 Vigiando {pasta_pdfs} (varredura a cada {intervalo}s)")
+
+    pool = multiprocessing.Pool(
+        processes=max(workers, 1),
+        maxtasksperchild=arquivos_por_worker or None,
+        initializer=_iniciar_worker,
+        initargs=(
+            pasta_saida_excel,
+            pasta_cache,
+            cache_limite_mb,
+            motor,
+            paginas_verificacao
+        )
+    )
+
+    enfileirados = {}  # caminho -> assinatura já enviada aos workers
+    pendentes = {}     # caminho -> (assinatura, desde quando está estável)
+
+    def observar(caminho: Path, agora: float) -> None:
+        try:
+            assinatura = _assinatura(caminho)
+        except FileNotFoundError:
+            pendentes.pop(caminho, None)
+            return
+        if enfileirados.get(caminho) == assinatura:
+            return
+        anterior = pendentes.get(caminho)
+        if not anterior or anterior[0] != assinatura:
+            pendentes[caminho] = (assinatura, agora)
+
+    saidas = abrir_saidas(base_consulta=base_consulta, ndjson=ndjson)
+    usos_motores = Counter()
+
+    # gravar e falhou rodam na thread de resultados do pool, um resultado
+    # por vez (o índice só é usado ali). Uma exceção ali encerraria essa
+    # thread (e o pool deixaria de entregar resultados), então cada erro é
+    # só relatado.
+    def gravar(retorno: tuple) -> None:
+        saida, resultado, _, usos = retorno
+        print(saida, end="", flush=True)
+        usos_motores.update(usos)
+        if not resultado:
+            return
+
+        gravado = _gravar_no_principal(resultado, indice, opcoes_gravacao)
+        sys.stdout.flush()
+        if not gravado:
+            return
+
+        dados = resultado.dados
+        for destino in saidas:
+            try:
+                destino.adicionar(dados)
+            except Exception as e:
+                print(
+                    f"❌ Erro ao gravar {dados.protocolo} em "
+                    f"{type(destino).__name__}: {e}",
+                    flush=True
+                )
+
+    # erro fora de analisar_pdf (o worker morreu, o resultado não voltou):
+    # o PDF só é tentado de novo se for alterado
+    def falhou(caminho: Path):
+        def relatar(erro: BaseException) -> None:
+            print(f"❌ Erro ao processar {caminho.name}: {erro}", flush=True)
+        return relatar
+
+    # o que já está na pasta ao iniciar
+    for pdf in sorted(pasta_pdfs.glob("*.pdf")):
+        observar(pdf, time.monotonic())
+
+    try:
+        while True:
+            if observador:
+                try:
+                    caminho = eventos.get(timeout=intervalo)
+                    observar(caminho, time.monotonic())
+                    while True:
+                        observar(eventos.get_nowait(), time.monotonic())
+                except queue.Empty:
+                    pass
+            else:
+                time.sleep(intervalo)
+                for pdf in pasta_pdfs.glob("*.pdf"):
+                    observar(pdf, time.monotonic())
+
+            agora = time.monotonic()
+            for caminho, (assinatura, desde) in list(pendentes.items()):
+                observar(caminho, agora)
+                if pendentes.get(caminho) != (assinatura, desde):
+                    continue  # mudou (ou sumiu) desde a última olhada
+                if agora - desde < estabilidade:
+                    continue
+
+                del pendentes[caminho]
+                enfileirados[caminho] = assinatura
+                pool.apply_async(
+                    _analisar_pdf_worker,
+                    ((caminho, None, opcoes_analise, SEM_MEDICAO),),
+                    callback=gravar,
+                    error_callback=falhou(caminho)
+                )
+
+    except KeyboardInterrupt:
+        print("\n🛑 Encerrando: aguardando os PDFs em andamento...")
+
+    finally:
+        if observador:
+            observador.stop()
+            observador.join()
+        pool.close()
+        pool.join()
+        for destino in saidas:
+            destino.fechar()
+        imprimir_uso_motores(usos_motores)
+
+# 13. UM ÚNICO PDF (sem índice: sempre reprocessa)
+def processar_arquivo(
+    pdf: Path,
+    json_saida: Path,
+    excel_saida: Path,
+    excel_docentes: Path = None,
+    cache: CacheTextos = None,
+    leitura_seletiva: bool = True,
+    motor: ExtratorTexto = None
+) -> dict:
+    for destino in (json_saida, excel_saida, excel_docentes):
+        if destino:
+            destino.parent.mkdir(parents=True, exist_ok=True)
+
+    relatorio = ler_relatorio(pdf, cache, leitura_seletiva, motor)
+    dados = pdf_para_json(relatorio, json_saida)
+    json_para_excel(
+        como_avaliacao(dados)._replace(protocolo=relatorio.protocolo),
+        excel_saida
+    )
+
+    if excel_docentes:
+        info_curso = dados["Informações curso"]
+        docentes = extrair_docentes(
+            relatorio,
+            info_curso["Ato Regulatório"],
+            info_curso
+        )
+        docentes_para_excel(docentes, excel_docentes)
+
+    return dados
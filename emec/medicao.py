@@ -0,0 +1,135 @@
+# Tempos por PDF/etapa e resumo da execução
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+# INSTRUMENTAÇÃO
+# Registro por PDF: tempo de cada etapa, páginas, itens, uso do cache,
+# motor de extração (e recuo para o pdfplumber) e motivo de pulo/erro.
+# Desligada, processar_pdf recebe SEM_MEDICAO, cujos métodos não fazem
+# nada.
+class MedicaoPDF:
+    def __init__(self, pdf: Path):
+        self.registro = {
+            "arquivo": pdf.name,
+            "protocolo": "",
+            "situacao": "",
+            "paginas": 0,
+            "itens": 0,
+            "docentes": 0,
+            "cache": "",
+            "motor": "",
+            "erro": "",
+            "etapas": {},
+            "tempo_total_s": 0.0
+        }
+        self._inicio = time.perf_counter()
+
+    @contextmanager
+    def etapa(self, nome: str):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.somar_etapa(nome, time.perf_counter() - inicio)
+
+    # tempo medido fora do PDF (a parte dele num bloco vetorizado)
+    def somar_etapa(self, nome: str, segundos: float) -> None:
+        etapas = self.registro["etapas"]
+        etapas[nome] = round(etapas.get(nome, 0.0) + segundos, 4)
+
+    # tempo em que o PDF só esperou (pelos outros do bloco) fica fora do total
+    def descontar(self, segundos: float) -> None:
+        self._inicio += segundos
+
+    def anotar(self, **campos) -> None:
+        self.registro.update(campos)
+
+    def concluir(self, situacao: str) -> None:
+        self.registro["situacao"] = situacao
+        self.registro["tempo_total_s"] = round(
+            time.perf_counter() - self._inicio,
+            4
+        )
+
+class _SemMedicao:
+    registro = None
+
+    def etapa(self, nome: str):
+        return nullcontext()
+
+    def somar_etapa(self, nome: str, segundos: float) -> None:
+        pass
+
+    def descontar(self, segundos: float) -> None:
+        pass
+
+    def anotar(self, **campos) -> None:
+        pass
+
+    def concluir(self, situacao: str) -> None:
+        pass
+
+SEM_MEDICAO = _SemMedicao()
+
+# log JSON-lines da execução + resumo no fim do lote
+class RelatorioExecucao:
+    def __init__(self, caminho_log: Path, mais_lentos: int = 10):
+        self.caminho_log = caminho_log
+        self.mais_lentos = mais_lentos
+        self.registros = []
+        self.caminho_log.parent.mkdir(parents=True, exist_ok=True)
+        self.arquivo = open(caminho_log, "a", encoding="utf-8")
+
+    def adicionar(self, registro: dict) -> None:
+        if not registro:
+            return
+        self.registros.append(registro)
+        self.arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self.arquivo.flush()
+
+    def fechar(self) -> None:
+        self.arquivo.close()
+        self.imprimir_resumo()
+
+    def imprimir_resumo(self) -> None:
+        if not self.registros:
+            return
+
+        situacoes = {}
+        motores = {}
+        por_etapa = {}
+        for registro in self.registros:
+            situacao = registro["situacao"]
+            situacoes[situacao] = situacoes.get(situacao, 0) + 1
+            motor = registro.get("motor")
+            if motor:
+                motores[motor] = motores.get(motor, 0) + 1
+            for etapa, tempo in registro["etapas"].items():
+                por_etapa[etapa] = por_etapa.get(etapa, 0.0) + tempo
+
+        total = sum(r["tempo_total_s"] for r in self.registros)
+
+        print(f"\n📊 Resumo: {len(self.registros)} PDFs em {total:.1f}s (soma por arquivo)")
+        for situacao, quantidade in sorted(situacoes.items()):
+            print(f"   {situacao:<28}{quantidade:>8}")
+
+        if motores:
+            print(f"\n   {'motor de extração':<28}{'PDFs':>8}")
+            for motor, quantidade in sorted(motores.items()):
+                print(f"   {motor:<28}{quantidade:>8}")
+
+        print(f"\n   {'etapa':<28}{'tempo (s)':>12}{'%':>8}")
+        for etapa, tempo in sorted(por_etapa.items(), key=lambda e: -e[1]):
+            parcela = tempo / total * 100 if total else 0
+            print(f"   {etapa:<28}{tempo:>12.2f}{parcela:>7.1f}%")
+
+        lentos = sorted(self.registros, key=lambda r: -r["tempo_total_s"])
+        print(f"\n   {'mais lentos':<40}{'páginas':>8}{'tempo (s)':>12}")
+        for registro in lentos[:self.mais_lentos]:
+            print(
+                f"   {registro['arquivo'][:40]:<40}"
+                f"{registro['paginas']:>8}{registro['tempo_total_s']:>12.2f}"
+            )
+        print(f"\n📝 Log da execução: {self.caminho_log}")
@@ -0,0 +1,244 @@
+# Motores de extração de texto
+#
+# Quase todo o tempo do extract_text() do pdfplumber vai na montagem dos
+# objetos de cada caractere (um dict com dezenas de atributos resolvidos);
+# o agrupamento em palavras e linhas é uma fração pequena. Os motores
+# rápidos produzem só os campos que esse agrupamento usa e chamam o mesmo
+# algoritmo do pdfplumber (chars_to_textmap), então o texto sai igual:
+#   - pdfminer: os caracteres do layout do pdfminer (o mesmo que o
+#     pdfplumber usa por baixo), sem a conversão para dicts completos;
+#   - pdfium: as caixas dos caracteres lidas pelo pdfium (C), bem mais
+#     rápido; depende do pypdfium2 decodificar o texto como o pdfminer.
+#     Todo caractere sai como upright (texto girado não é reconhecido) e
+#     as coordenadas ignoram o deslocamento da mediabox; valem para os
+#     relatórios impressos pelo navegador (páginas retas, mediabox na
+#     origem), não para um PDF qualquer.
+# "auto" escolhe o pdfium quando instalado e, sem ele, o pdfminer.
+#
+# Cada documento é conferido: as `paginas_verificacao` páginas com mais
+# texto são extraídas também pelo pdfplumber e, se alguma diferir (ou o
+# motor rápido falhar), o documento inteiro é refeito pelo pdfplumber.
+# As demais páginas não são conferidas, por isso o padrão continua sendo
+# o pdfplumber: os motores rápidos são escolhidos com --motor.
+from collections import Counter
+from importlib import metadata
+
+from .texto import abrir_pdf, fonte_pdf, iterar_paginas, versao_pdfplumber
+
+MOTOR_PADRAO = "pdfplumber"
+MOTOR_RECUO = "pdfplumber (recuo)"  # como aparece no log e nos resumos
+
+def _versao(pacote: str) -> str:
+    try:
+        return metadata.version(pacote)
+    except metadata.PackageNotFoundError:
+        return ""
+
+def _texto_dos_caracteres(caracteres: list) -> str:
+    from pdfplumber.utils.text import chars_to_textmap
+
+    # mesmos padrões do Page.extract_text() (layout=False)
+    return chars_to_textmap(caracteres).as_string if caracteres else ""
+
+class MotorPdfplumber:
+    nome = "pdfplumber"
+
+    def versao(self) -> str:
+        return versao_pdfplumber()
+
+    def extrair(self, caminho_pdf, paginas: set = None) -> list:
+        return list(iterar_paginas(caminho_pdf, paginas=paginas))
+
+class MotorPdfminer:
+    nome = "pdfminer"
+
+    def versao(self) -> str:
+        return f"{versao_pdfplumber()}+pdfminer-{_versao('pdfminer.six')}"
+
+    def extrair(self, caminho_pdf, paginas: set = None) -> list:
+        from pdfminer.layout import LTChar, LTContainer
+
+        # coordenadas calculadas como em Page.process_object
+        def caracteres(pagina) -> list:
+            altura = pagina.height
+            mb_x0, mb_top = pagina.mediabox[:2]
+            encontrados = []
+
+            def percorrer(objetos) -> None:
+                for objeto in objetos:
+                    if isinstance(objeto, LTContainer):
+                        percorrer(objeto._objs)
+                    elif isinstance(objeto, LTChar):
+                        top = altura - objeto.y1 + mb_top
+                        encontrados.append({
+                            "text": objeto.get_text(),
+                            "x0": objeto.x0 + mb_x0,
+                            "x1": objeto.x1 + mb_x0,
+                            "top": top,
+                            "bottom": altura - objeto.y0 + mb_top,
+                            "doctop": pagina.initial_doctop + top,
+                            "upright": objeto.upright,
+                            "size": objeto.size
+                        })
+
+            percorrer(pagina.layout._objs)
+            return encontrados
+
+        textos = []
+        with abrir_pdf(caminho_pdf) as pdf:
+            for indice, pagina in enumerate(pdf.pages):
+                if paginas is not None and indice not in paginas:
+                    textos.append("")
+                    continue
+                try:
+                    textos.append(_texto_dos_caracteres(caracteres(pagina)))
+                finally:
+                    pagina.close()
+        return textos
+
+class MotorPdfium:
+    nome = "pdfium"
+
+    def versao(self) -> str:
+        return f"{versao_pdfplumber()}+pypdfium2-{_versao('pypdfium2')}"
+
+    def extrair(self, caminho_pdf, paginas: set = None) -> list:
+        import pypdfium2
+        import pypdfium2.raw as pdfium_c
+
+        def caracteres(texto, altura: float) -> list:
+            encontrados = []
+            for indice in range(texto.count_chars()):
+                # espaços e quebras que o pdfium sintetiza não existem no PDF
+                if pdfium_c.FPDFText_IsGenerated(texto, indice):
+                    continue
+                x0, y0, x1, y1 = texto.get_charbox(indice, loose=True)
+                # sem rotação nem deslocamento da mediabox (ver o início)
+                encontrados.append({
+                    "text": chr(pdfium_c.FPDFText_GetUnicode(texto, indice)),
+                    "x0": x0,
+                    "x1": x1,
+                    "top": altura - y1,
+                    "bottom": altura - y0,
+                    "doctop": altura - y1,
+                    "upright": True,
+                    "size": y1 - y0
+                })
+            return encontrados
+
+        documento = pypdfium2.PdfDocument(fonte_pdf(caminho_pdf))
+        try:
+            textos = []
+            for indice in range(len(documento)):
+                if paginas is not None and indice not in paginas:
+                    textos.append("")
+                    continue
+                pagina = documento[indice]
+                texto = pagina.get_textpage()
+                try:
+                    textos.append(_texto_dos_caracteres(
+                        caracteres(texto, pagina.get_height())
+                    ))
+                finally:
+                    texto.close()
+                    pagina.close()
+            return textos
+        finally:
+            documento.close()
+
+MOTORES = {
+    "pdfplumber": MotorPdfplumber,
+    "pdfminer": MotorPdfminer,
+    "pdfium": MotorPdfium
+}
+
+def resolver_motor(nome: str = MOTOR_PADRAO) -> str:
+    if nome != "auto":
+        return nome
+    return "pdfium" if _versao("pypdfium2") else "pdfminer"
+
+class ExtratorTexto:
+    def __init__(self, nome: str = MOTOR_PADRAO, paginas_verificacao: int = 1):
+        nome = resolver_motor(nome)
+        if nome == "pdfium" and not _versao("pypdfium2"):
+            raise RuntimeError(
+                "O motor pdfium requer o pacote pypdfium2 (pip install pypdfium2)."
+            )
+
+        self.motor = MOTORES[nome]()
+        self.referencia = MotorPdfplumber()
+        self.paginas_verificacao = paginas_verificacao
+        self.recuos = 0
+        # PDFs extraídos por motor efetivo (um recuo conta como pdfplumber);
+        # nos modos com processos, cada worker devolve a parte de cada PDF
+        # junto com o resultado (ver lote._analisar_pdf_worker)
+        self.usos = Counter()
+
+    @property
+    def nome(self) -> str:
+        return self.motor.nome
+
+    # identifica o motor na chave do cache; o pdfplumber mantém a chave antiga
+    @property
+    def identificacao(self) -> str:
+        if self.motor.nome == "pdfplumber":
+            return ""
+        return f"{self.motor.nome}-{self.motor.versao()}"
+
+    def _divergencia(self, caminho_pdf, textos: list, paginas: set) -> int:
+        candidatas = range(len(textos)) if paginas is None else sorted(paginas)
+        amostra = sorted(
+            candidatas,
+            key=lambda indice: -len(textos[indice])
+        )[:self.paginas_verificacao]
+        if not amostra:
+            return None
+
+        referencia = self.referencia.extrair(caminho_pdf, set(amostra))
+        for indice in sorted(amostra):
+            if referencia[indice] != textos[indice]:
+                return indice
+        return None
+
+    # sonda do protocolo: só as primeiras páginas, sem conferência (basta
+    # achar os dígitos; o protocolo do texto conferido prevalece depois).
+    # Se o motor falhar, a sonda usa o pdfplumber calada: o recuo é avisado
+    # e contado na extração completa, que falha do mesmo jeito.
+    def sondar(self, caminho_pdf, paginas: int = 1) -> list:
+        primeiras = set(range(paginas))
+        try:
+            return self.motor.extrair(caminho_pdf, primeiras)[:paginas]
+        except Exception:
+            return self.referencia.extrair(caminho_pdf, primeiras)[:paginas]
+
+    def extrair(self, caminho_pdf, paginas: set = None) -> list:
+        if self.motor.nome == "pdfplumber":
+            textos = self.referencia.extrair(caminho_pdf, paginas)
+            self.usos[self.nome] += 1
+            return textos
+
+        try:
+            textos = self.motor.extrair(caminho_pdf, paginas)
+            divergente = self._divergencia(caminho_pdf, textos, paginas)
+            if divergente is None:
+                self.usos[self.nome] += 1
+                return textos
+            motivo = f"texto diferente do pdfplumber na página {divergente + 1}"
+        except Exception as e:
+            motivo = f"{type(e).__name__}: {e}"
+
+        self.recuos += 1
+        print(f"↩️ Motor {self.nome}: {motivo}. Usando o pdfplumber.")
+        textos = self.referencia.extrair(caminho_pdf, paginas)
+        self.usos[MOTOR_RECUO] += 1
+        return textos
+
+# uma linha no fim de todo lote, com ou sem --log-execucao (acertos do
+# cache e PDFs pulados pelo índice não passam pelo motor)
+def imprimir_uso_motores(usos: Counter) -> None:
+    if not usos:
+        print("🔧 PDFs extraídos por motor: nenhum (cache ou pulados)")
+        return
+
+    partes = [f"{motor} {quantidade}" for motor, quantidade in sorted(usos.items())]
+    print(f"🔧 PDFs extraídos por motor: {', '.join(partes)}")
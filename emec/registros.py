@@ -0,0 +1,268 @@
+# Modelo compacto de uma avaliação
+#
+# O JSON de cada relatório é um dict de listas de dicts de uma chave só
+# ({titulo: {"Nota": ..., "Justificativa": ...}}), e cada linha do Excel
+# repete os campos do curso. Num lote grande isso vira milhões de dicts
+# pequenos e de strings repetidas. Aqui cada item é uma tupla nomeada, a
+# nota é um inteiro pequeno, dimensões e campos do curso são strings
+# internadas, e o lote guarda colunas (array/listas) em vez de linhas.
+# para_json() devolve exatamente o layout do JSON de sempre.
+import sys
+from array import array
+from typing import NamedTuple
+
+DIMENSOES = (
+    "ORGANIZAÇÃO DIDÁTICO-PEDAGÓGICA",
+    "CORPO DOCENTE E TUTORIAL",
+    "INFRAESTRUTURA"
+)
+
+# prefixo do título -> dimensão (mesma regra de inserir_dados)
+PREFIXOS_DIMENSAO = ("1.", "2.", "3.")
+
+COLUNAS_EXCEL = [
+    "Protocolo",
+    "Curso",
+    "Campus",
+    "Ano da avaliação",
+    "Ato Regulatório",
+    "Conceito Final Contínuo",
+    "Conceito Final Faixa",
+    "Dimensão",
+    "Item",
+    "Nota",
+    "Justificativa"
+]
+
+JUSTIFICATIVA_NSA = "NSA. Não se aplica."
+
+# Nota: "0".."9" viram o próprio número; "NSA" e vazio têm códigos negativos
+NOTA_NSA = -1
+NOTA_VAZIA = -2
+
+# nota 6 é a que pdf_para_json atribui aos itens sem justificativa (NSA)
+NOTA_SEM_JUSTIFICATIVA = 6
+
+def e_nsa(codigo: int) -> bool:
+    return codigo in (NOTA_NSA, NOTA_SEM_JUSTIFICATIVA)
+
+def codificar_nota(nota: str) -> int:
+    if nota.isdigit():
+        return int(nota)
+    if nota.upper() == "NSA":
+        return NOTA_NSA
+    if not nota:
+        return NOTA_VAZIA
+    raise ValueError(f"Nota inesperada: {nota!r}")
+
+def decodificar_nota(codigo: int) -> str:
+    if codigo >= 0:
+        return str(codigo)
+    return "NSA" if codigo == NOTA_NSA else ""
+
+def _internar(valor: str) -> str:
+    return sys.intern(valor) if valor else ""
+
+class InformacoesCurso(NamedTuple):
+    nome: str = ""
+    campus: str = ""
+    ano: str = ""
+    ato: str = ""
+    conceito_continuo: str = ""
+    conceito_faixa: str = ""
+
+    # chaves do bloco "Informações curso" do JSON, na ordem dos campos
+    CHAVES_JSON = (
+        "Nome",
+        "Campus",
+        "Ano da avaliação",
+        "Ato Regulatório",
+        "CONCEITO FINAL CONTÍNUO",
+        "CONCEITO FINAL FAIXA"
+    )
+
+    @classmethod
+    def de_dict(cls, info: dict) -> "InformacoesCurso":
+        return cls(*(_internar(info.get(chave, "")) for chave in cls.CHAVES_JSON))
+
+    def para_dict(self) -> dict:
+        return dict(zip(self.CHAVES_JSON, self))
+
+class ItemAvaliado(NamedTuple):
+    dimensao: int  # índice em DIMENSOES
+    titulo: str
+    nota: int      # ver codificar_nota
+    justificativa: str
+
+class AvaliacaoCurso(NamedTuple):
+    info: InformacoesCurso
+    itens: tuple
+    protocolo: str = ""  # não faz parte do JSON; primeira coluna das linhas
+
+    # itens = {titulo: {"Nota", "Justificativa"}}, como em pdf_para_json
+    @classmethod
+    def de_itens(cls, info: dict, itens: dict) -> "AvaliacaoCurso":
+        avaliados = []
+        for titulo, dados in sorted(itens.items()):
+            for dimensao, prefixo in enumerate(PREFIXOS_DIMENSAO):
+                if titulo.startswith(prefixo):
+                    break
+            else:
+                continue  # fora das três dimensões: não entra no JSON
+
+            # a justificativa padrão vira a mesma string em todos os itens
+            justificativa = dados["Justificativa"]
+            if justificativa == JUSTIFICATIVA_NSA:
+                justificativa = JUSTIFICATIVA_NSA
+
+            avaliados.append(ItemAvaliado(
+                dimensao,
+                sys.intern(titulo),
+                codificar_nota(dados["Nota"]),
+                justificativa
+            ))
+
+        # itens de uma mesma dimensão ficam juntos, na ordem do título
+        avaliados.sort(key=lambda item: item.dimensao)
+        return cls(InformacoesCurso.de_dict(info), tuple(avaliados))
+
+    @classmethod
+    def de_json(cls, estrutura: dict) -> "AvaliacaoCurso":
+        avaliados = []
+        for dimensao, nome in enumerate(DIMENSOES):
+            for item in estrutura["Dimensões"].get(nome, []):
+                for titulo, dados in item.items():
+                    avaliados.append(ItemAvaliado(
+                        dimensao,
+                        sys.intern(titulo),
+                        codificar_nota(dados["Nota"]),
+                        dados["Justificativa"]
+                    ))
+
+        return cls(
+            InformacoesCurso.de_dict(estrutura["Informações curso"]),
+            tuple(avaliados)
+        )
+
+    def para_json(self) -> dict:
+        dimensoes = {nome: [] for nome in DIMENSOES}
+        for item in self.itens:
+            dimensoes[DIMENSOES[item.dimensao]].append({
+                item.titulo: {
+                    "Nota": decodificar_nota(item.nota),
+                    "Justificativa": item.justificativa
+                }
+            })
+
+        return {
+            "Informações curso": self.info.para_dict(),
+            "Dimensões": dimensoes
+        }
+
+    # uma tupla por item, na ordem de COLUNAS_EXCEL
+    def linhas(self):
+        info = self.info
+        for item in self.itens:
+            yield (
+                self.protocolo,
+                info.nome,
+                info.campus,
+                info.ano,
+                info.ato,
+                info.conceito_continuo,
+                info.conceito_faixa,
+                DIMENSOES[item.dimensao],
+                item.titulo,
+                decodificar_nota(item.nota),
+                item.justificativa
+            )
+
+def como_avaliacao(dados) -> AvaliacaoCurso:
+    if isinstance(dados, AvaliacaoCurso):
+        return dados
+    return AvaliacaoCurso.de_json(dados)
+
+# Lote em colunas: protocolo e campos do curso ficam uma vez por relatório
+# (a linha guarda só o índice do curso), dimensão e nota em arrays de bytes.
+class LoteAvaliacoes:
+    __slots__ = (
+        "protocolos",
+        "cursos",
+        "curso",
+        "dimensao",
+        "titulo",
+        "nota",
+        "justificativa"
+    )
+
+    def __init__(self):
+        self.protocolos = []
+        self.cursos = []
+        self.curso = array("I")
+        self.dimensao = array("B")
+        self.titulo = []
+        self.nota = array("b")
+        self.justificativa = []
+
+    def __len__(self) -> int:
+        return len(self.titulo)
+
+    def adicionar(self, avaliacao: AvaliacaoCurso) -> None:
+        indice = len(self.cursos)
+        self.protocolos.append(avaliacao.protocolo)
+        self.cursos.append(avaliacao.info)
+
+        for item in avaliacao.itens:
+            self.curso.append(indice)
+            self.dimensao.append(item.dimensao)
+            self.titulo.append(item.titulo)
+            self.nota.append(item.nota)
+            self.justificativa.append(item.justificativa)
+
+    def limpar(self) -> None:
+        self.__init__()
+
+    # numerico=True: Nota e conceitos como números ("NSA" e vazios -> nulo)
+    def para_dataframe(self, numerico: bool = False):
+        import numpy as np
+        import pandas as pd
+
+        curso = np.frombuffer(self.curso, dtype=np.uint32)
+        nota = np.frombuffer(self.nota, dtype=np.int8)
+
+        def do_curso(valores: list, dtype=object):
+            return np.asarray(valores, dtype=dtype)[curso]
+
+        colunas = {"Protocolo": do_curso(self.protocolos)}
+        for coluna, campo in zip(COLUNAS_EXCEL[1:7], InformacoesCurso._fields):
+            colunas[coluna] = do_curso([getattr(c, campo) for c in self.cursos])
+
+        colunas["Dimensão"] = np.asarray(DIMENSOES, dtype=object)[
+            np.frombuffer(self.dimensao, dtype=np.uint8)
+        ]
+        colunas["Item"] = self.titulo
+
+        if numerico:
+            colunas["Conceito Final Contínuo"] = do_curso(
+                [_para_float(c.conceito_continuo) for c in self.cursos],
+                dtype="float64"
+            )
+            colunas["Conceito Final Faixa"] = pd.array(
+                do_curso([_para_float(c.conceito_faixa) for c in self.cursos], "float64")
+            ).astype("Int64")
+            colunas["Nota"] = pd.arrays.IntegerArray(
+                nota.astype("int64"),
+                nota < 0
+            )
+        else:
+            colunas["Nota"] = [decodificar_nota(n) for n in self.nota]
+
+        colunas["Justificativa"] = self.justificativa
+
+        return pd.DataFrame(colunas, columns=COLUNAS_EXCEL)
+
+def _para_float(valor: str) -> float:
+    try:
+        return float(valor.strip().replace(",", "."))
+    except ValueError:
+        return float("nan")
@@ -0,0 +1,204 @@
+# Relatório lido uma vez e conversão PDF -> JSON
+import re
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .texto import CacheTextos, abrir_pdf, extrair_paginas, iterar_paginas, juntar_paginas, limpar_texto
+from .extracao import (
+    PADRAO_DOCENTE,
+    _registros_da_tabela,
+    _registros_do_texto,
+    campos_ausentes,
+    extrair_informacoes_curso,
+    extrair_notas_justificativas,
+    extrair_protocolo,
+    extrair_todos_itens,
+    fim_cabecalho,
+    localizar_paginas_docentes,
+    paginas_conceito
+)
+from .registros import JUSTIFICATIVA_NSA, AvaliacaoCurso
+from .motores import ExtratorTexto
+
+# Relatório lido uma única vez: todas as etapas reaproveitam o mesmo texto
+@dataclass
+class RelatorioPDF:
+    caminho: Path  # ou o conteúdo do PDF em memória (ver texto.abrir_pdf)
+    paginas: list = field(default_factory=list)
+    texto_bruto: str = ""
+    texto: str = ""
+    protocolo: str = ""
+    paginas_docentes: list = field(default_factory=list)
+    texto_cabecalho: str = None  # páginas do cabeçalho, limpas
+    texto_conceito: str = None   # página do CONCEITO FINAL e a seguinte, limpas
+
+def ler_relatorio(
+    caminho_pdf: Path,
+    cache: CacheTextos = None,
+    seletiva: bool = True,
+    motor: ExtratorTexto = None
+) -> RelatorioPDF:
+    paginas = extrair_paginas(caminho_pdf, cache, seletiva, motor)
+    texto_bruto = juntar_paginas(paginas, "\n")
+
+    ultima_cabecalho = fim_cabecalho(paginas)
+    texto_cabecalho = None
+    if ultima_cabecalho is not None:
+        texto_cabecalho = limpar_texto(
+            juntar_paginas(paginas[:ultima_cabecalho + 1], " ")
+        )
+
+    tabela_conceito = paginas_conceito(paginas)
+    texto_conceito = None
+    if tabela_conceito:
+        texto_conceito = limpar_texto(
+            juntar_paginas(paginas[tabela_conceito.start:tabela_conceito.stop], " ")
+        )
+
+    return RelatorioPDF(
+        caminho=caminho_pdf,
+        paginas=paginas,
+        texto_bruto=texto_bruto,
+        texto=limpar_texto(juntar_paginas(paginas, " ")),
+        protocolo=extrair_protocolo(texto_bruto),
+        paginas_docentes=localizar_paginas_docentes(paginas),
+        texto_cabecalho=texto_cabecalho,
+        texto_conceito=texto_conceito
+    )
+
+# docentes das tabelas com bordas, página a página (reabre o PDF)
+def _docentes_das_tabelas(relatorio: RelatorioPDF, inicio: int, fim: int) -> list:
+    encontrados = []
+    with abrir_pdf(relatorio.caminho) as pdf:
+        for pagina in pdf.pages[inicio:fim]:
+            try:
+                registros = _registros_da_tabela(pagina)
+            finally:
+                pagina.close()
+            encontrados += [PADRAO_DOCENTE.search(r) for r in registros]
+    return [m for m in encontrados if m]
+
+def extrair_docentes(
+    relatorio: RelatorioPDF,
+    ato_regulatorio: str,
+    info_curso: dict
+) -> list:
+    docentes = []
+
+    if not relatorio.paginas_docentes:
+        return docentes
+
+    inicio = relatorio.paginas_docentes[0]
+    fim = relatorio.paginas_docentes[-1] + 1
+
+    # do texto já extraído; se algum registro não casar (ou não houver
+    # nenhum), vale a tabela, quando ela trouxer docentes
+    registros = _registros_do_texto(juntar_paginas(relatorio.paginas[inicio:fim], "\n"))
+    encontrados = [PADRAO_DOCENTE.search(r) for r in registros]
+    if not encontrados or not all(encontrados):
+        encontrados = _docentes_das_tabelas(relatorio, inicio, fim) or encontrados
+
+    for m in encontrados:
+        if not m:
+            continue
+
+        nome = re.sub(r'\s+', ' ', m.group("nome")).strip()
+
+        docente = {
+            "Nome do Docente": nome,
+            "Titulação": m.group("titulacao").capitalize(),
+            "Regime de Trabalho": m.group("regime").capitalize(),
+            "Vínculo Empregatício": m.group("vinculo").upper(),
+            "Curso": info_curso["Nome"],
+            "Campus": info_curso["Campus"],
+            "Ano da avaliação": info_curso["Ano da avaliação"],
+            "Ato Regulatório": info_curso["Ato Regulatório"]
+        }
+
+        if ato_regulatorio.lower() == "reconhecimento":
+            docente["Tempo de vínculo (meses)"] = m.group("meses")
+
+        docentes.append(docente)
+
+    return docentes
+
+# Sonda barata: o campo "Protocolo:" fica no cabeçalho da primeira página
+def sondar_protocolo(
+    caminho_pdf: Path,
+    paginas: int = 1,
+    cache: CacheTextos = None,
+    seletiva: bool = True,
+    motor: ExtratorTexto = None
+) -> str:
+    if cache:
+        chave = cache.chave(caminho_pdf, seletiva, motor.identificacao if motor else "")
+        em_cache = cache.ler(chave)
+        if em_cache is not None:
+            return extrair_protocolo(juntar_paginas(em_cache, "\n"))
+
+    if motor:
+        textos = motor.sondar(caminho_pdf, paginas)
+    else:
+        textos = iterar_paginas(caminho_pdf, fim=paginas)
+
+    for conteudo in textos:
+        protocolo = extrair_protocolo(conteudo)
+        if protocolo:
+            return protocolo
+    return ""
+
+# 8. PIPELINE PDF -> JSON
+# montar_avaliacao só calcula; gravar_json só escreve (o modo assíncrono
+# roda cada parte num estágio diferente)
+# campo não encontrado nos trechos de extrair_informacoes_curso é avisado
+def informacoes_curso(relatorio: RelatorioPDF) -> dict:
+    cabecalho = relatorio.texto_cabecalho
+    info = extrair_informacoes_curso(
+        relatorio.texto if cabecalho is None else cabecalho,
+        relatorio.texto_conceito
+    )
+
+    ausentes = campos_ausentes(info)
+    if ausentes:
+        print(
+            f"⚠️ Protocolo {relatorio.protocolo or '?'}: não encontrado(s) no "
+            f"cabeçalho nem na página do conceito final: {', '.join(ausentes)}"
+        )
+    return info
+
+def montar_avaliacao(relatorio: RelatorioPDF) -> AvaliacaoCurso:
+    texto = relatorio.texto
+
+    info = informacoes_curso(relatorio)
+
+    todos_itens = extrair_todos_itens(texto)
+    itens_avaliados = extrair_notas_justificativas(texto)
+
+    # sobrescreve quando existir nota/justificativa
+    for k, v in itens_avaliados.items():
+        todos_itens[k] = v
+
+    # 🔥 REGRA FINAL: sem justificativa → Nota 6 + NSA
+    for item, dados in todos_itens.items():
+        if not dados["Justificativa"]:
+            dados["Nota"] = "6"
+            dados["Justificativa"] = JUSTIFICATIVA_NSA
+
+    return AvaliacaoCurso.de_itens(info, todos_itens)._replace(
+        protocolo=relatorio.protocolo
+    )
+
+def montar_json(relatorio: RelatorioPDF) -> dict:
+    return montar_avaliacao(relatorio).para_json()
+
+def gravar_json(estrutura: dict, json_path: Path) -> None:
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(estrutura, f, ensure_ascii=False, indent=4)
+
+    print(f"✅ JSON gerado: {json_path}")
+
+def pdf_para_json(relatorio: RelatorioPDF, json_path: Path) -> dict:
+    estrutura = montar_json(relatorio)
+    gravar_json(estrutura, json_path)
+    return estrutura
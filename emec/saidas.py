@@ -0,0 +1,457 @@
+# Saídas: Excel por protocolo, planilha consolidada, exportação colunar e
+# NDJSON do lote
+import io
+import os
+import re
+import csv
+import gzip
+import zlib
+import json
+from pathlib import Path
+
+from .registros import COLUNAS_EXCEL, LoteAvaliacoes, como_avaliacao
+
+# 9. JSON -> EXCEL
+# As funções recebem a AvaliacaoCurso ou o dict do JSON (convertido aqui)
+def linhas_excel(json_dados):
+    for linha in como_avaliacao(json_dados).linhas():
+        yield dict(zip(COLUNAS_EXCEL, linha))
+
+def json_para_excel(json_dados, caminho_excel: Path) -> None:
+    import pandas as pd
+
+    linhas = list(como_avaliacao(json_dados).linhas())
+
+    # sem itens, a planilha sai vazia (sem cabeçalho), como antes
+    pd.DataFrame(
+        linhas,
+        columns=COLUNAS_EXCEL if linhas else None
+    ).to_excel(caminho_excel, index=False, engine="openpyxl")
+    print(f"✅ Excel gerado: {caminho_excel}")
+
+# Planilha única com os cursos de todo o lote, gravada em modo write-only
+# do openpyxl: cada linha vai direto para o arquivo, sem DataFrame nem o
+# modelo completo da planilha em memória. Se o arquivo já existir, as
+# linhas antigas são copiadas (também em fluxo) antes das novas.
+# Com substituir=True (--reprocessar-desatualizados), as linhas antigas
+# de um protocolo gravado de novo saem da planilha no fechar(); o mesmo
+# vale para as outras saídas acrescentadas (Parquet, CSV e NDJSON).
+_COLUNA_PROTOCOLO = COLUNAS_EXCEL.index("Protocolo")
+_COLUNA_DIMENSAO = COLUNAS_EXCEL.index("Dimensão")
+
+class PlanilhaConsolidada:
+    ABA_UNICA = "Avaliações"
+
+    def __init__(
+        self,
+        caminho: Path,
+        por_dimensao: bool = False,
+        substituir: bool = False
+    ):
+        from openpyxl import Workbook
+
+        self.caminho = caminho
+        self.por_dimensao = por_dimensao
+        self.substituir = substituir
+        self.temporario = caminho.with_name(f"{caminho.stem}.tmp.xlsx")
+        self.livro = Workbook(write_only=True)
+        self.abas = {}
+        self.antigas = {}             # aba -> linhas copiadas do arquivo
+        self.protocolos_antigos = set()
+        self.protocolos_novos = set()
+
+        if caminho.exists():
+            self._copiar_existente()
+
+    def _aba(self, nome: str):
+        if nome not in self.abas:
+            # nome de aba do Excel: no máximo 31 caracteres
+            aba = self.livro.create_sheet(title=nome[:31])
+            aba.append(COLUNAS_EXCEL)
+            self.abas[nome] = aba
+        return self.abas[nome]
+
+    def _copiar_existente(self) -> None:
+        from openpyxl import load_workbook
+
+        antigo = load_workbook(self.caminho, read_only=True)
+        try:
+            for aba_antiga in antigo.worksheets:
+                linhas = aba_antiga.iter_rows(values_only=True)
+                cabecalho = list(next(linhas, None) or COLUNAS_EXCEL)
+                aba = self._aba(aba_antiga.title)
+                if self.substituir:
+                    linhas = self._contar_antigas(aba_antiga.title, cabecalho, linhas)
+
+                # planilha de antes da coluna Protocolo: as colunas vão para
+                # a posição atual pelo nome, e as que faltam ficam vazias
+                if cabecalho == COLUNAS_EXCEL:
+                    for linha in linhas:
+                        aba.append(list(linha))
+                    continue
+
+                posicoes = {coluna: i for i, coluna in enumerate(cabecalho)}
+                for linha in linhas:
+                    aba.append([
+                        linha[posicoes[coluna]] if coluna in posicoes else None
+                        for coluna in COLUNAS_EXCEL
+                    ])
+        finally:
+            antigo.close()
+
+    def _contar_antigas(self, titulo: str, cabecalho: list, linhas):
+        coluna = cabecalho.index("Protocolo") if "Protocolo" in cabecalho else None
+        self.antigas[titulo] = 0
+        for linha in linhas:
+            self.antigas[titulo] += 1
+            if coluna is not None and linha[coluna] is not None:
+                self.protocolos_antigos.add(str(linha[coluna]))
+            yield linha
+
+    def adicionar(self, json_dados) -> None:
+        avaliacao = como_avaliacao(json_dados)
+        if self.substituir:
+            self.protocolos_novos.add(avaliacao.protocolo)
+
+        for linha in avaliacao.linhas():
+            nome = linha[_COLUNA_DIMENSAO] if self.por_dimensao else self.ABA_UNICA
+            self._aba(nome).append(linha)
+
+    # write-only não apaga linhas: a planilha recém-gravada é copiada de
+    # novo, em fluxo, sem as linhas antigas dos protocolos refeitos. Só
+    # acontece quando algum protocolo do arquivo foi gravado de novo.
+    def _remover_substituidos(self) -> None:
+        from openpyxl import Workbook, load_workbook
+
+        repetidos = self.protocolos_antigos & self.protocolos_novos
+        if not repetidos:
+            return
+
+        livro = Workbook(write_only=True)
+        gravado = load_workbook(self.temporario, read_only=True)
+        try:
+            for aba_gravada in gravado.worksheets:
+                aba = livro.create_sheet(title=aba_gravada.title)
+                antigas = self.antigas.get(aba_gravada.title, 0)
+                linhas = aba_gravada.iter_rows(values_only=True)
+                aba.append(list(next(linhas)))  # cabeçalho
+
+                for numero, linha in enumerate(linhas):
+                    if numero < antigas and str(linha[_COLUNA_PROTOCOLO]) in repetidos:
+                        continue
+                    aba.append(list(linha))
+
+            refeito = self.caminho.with_name(f"{self.caminho.stem}.tmp2.xlsx")
+            livro.save(refeito)
+        finally:
+            gravado.close()
+
+        os.replace(refeito, self.temporario)
+
+    def fechar(self) -> None:
+        if not self.abas:
+            self._aba(self.ABA_UNICA)
+
+        self.livro.save(self.temporario)
+        if self.substituir:
+            self._remover_substituidos()
+        os.replace(self.temporario, self.caminho)
+        print(f"✅ Excel consolidado gerado: {self.caminho}")
+
+# Exportação colunar (Parquet particionado ou CSV compactado) com o mesmo
+# esquema do Excel, mas com Nota e conceitos como números ("NSA" e campos
+# vazios viram nulos) para leitura rápida no pandas/dashboards.
+COLUNAS_NUMERICAS = {
+    "Conceito Final Contínuo": "float64",
+    "Conceito Final Faixa": "Int64",
+    "Nota": "Int64"
+}
+
+PARTICOES_PARQUET = ["Ano da avaliação", "Ato Regulatório"]
+
+def _para_numero(valor: str):
+    valor = (valor or "").strip().replace(",", ".")
+    try:
+        numero = float(valor)
+    except ValueError:
+        return None
+    return int(numero) if numero.is_integer() else numero
+
+def linhas_tipadas(json_dados):
+    for linha in linhas_excel(json_dados):
+        for coluna in COLUNAS_NUMERICAS:
+            linha[coluna] = _para_numero(linha[coluna])
+        yield linha
+
+class ExportadorParquet:
+    def __init__(self, pasta: Path, lote: int = 5000, substituir: bool = False):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise RuntimeError(
+                "Exportação em Parquet requer o pacote pyarrow "
+                "(pip install pyarrow)."
+            )
+
+        self.pasta = pasta
+        self.lote = lote
+        self.linhas = LoteAvaliacoes()
+        self.pasta.mkdir(parents=True, exist_ok=True)
+
+        self.substituir = substituir
+        self.protocolos_novos = set()
+        # arquivos de execuções anteriores (os desta são sempre novos)
+        self.antigos = sorted(self.pasta.rglob("*.parquet")) if substituir else []
+
+    def adicionar(self, json_dados) -> None:
+        avaliacao = como_avaliacao(json_dados)
+        if self.substituir:
+            self.protocolos_novos.add(avaliacao.protocolo)
+
+        self.linhas.adicionar(avaliacao)
+        if len(self.linhas) >= self.lote:
+            self._gravar()
+
+    def _gravar(self) -> None:
+        if not len(self.linhas):
+            return
+
+        df = self.linhas.para_dataframe(numerico=True)
+        for coluna in PARTICOES_PARQUET:
+            df[coluna] = df[coluna].replace("", "Indefinido")
+
+        # cada gravação cria arquivos novos dentro das partições,
+        # então execuções anteriores são preservadas
+        df.to_parquet(
+            self.pasta,
+            engine="pyarrow",
+            partition_cols=PARTICOES_PARQUET,
+            index=False
+        )
+        self.linhas.limpar()
+
+    # cada arquivo antigo com algum protocolo refeito é regravado sem as
+    # linhas dele (ou removido, se não sobrar nenhuma); lê-se antes só a
+    # coluna Protocolo
+    def _remover_substituidos(self) -> None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        novos = pa.array(sorted(self.protocolos_novos), type=pa.string())
+        for arquivo in self.antigos:
+            arquivo_pq = pq.ParquetFile(arquivo)
+            if "Protocolo" not in arquivo_pq.schema_arrow.names:
+                continue  # arquivo de antes da coluna Protocolo
+
+            repetido = pc.is_in(
+                arquivo_pq.read(columns=["Protocolo"])["Protocolo"].cast(pa.string()),
+                value_set=novos
+            )
+            if not pc.any(repetido).as_py():
+                continue
+
+            tabela = arquivo_pq.read().filter(pc.invert(repetido))
+            arquivo_pq.close()
+            if not len(tabela):
+                arquivo.unlink()
+                continue
+
+            temporario = arquivo.with_name(f"{arquivo.stem}.tmp")
+            pq.write_table(tabela, temporario)
+            os.replace(temporario, arquivo)
+
+    def fechar(self) -> None:
+        self._gravar()
+        if self.substituir and self.protocolos_novos:
+            self._remover_substituidos()
+        print(f"✅ Parquet gerado: {self.pasta}")
+
+class ExportadorCSV:
+    def __init__(self, caminho: Path, substituir: bool = False):
+        self.caminho = caminho
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.substituir = substituir
+        self.protocolos_novos = set()
+        self.linhas_novas = 0
+
+        novo = not caminho.exists()
+        if not novo:
+            with gzip.open(caminho, "rt", encoding="utf-8", newline="") as f:
+                cabecalho = next(csv.reader(f), None)
+            if cabecalho and cabecalho != COLUNAS_EXCEL:
+                raise RuntimeError(
+                    f"{caminho} tem outras colunas ({', '.join(cabecalho)}); "
+                    "exporte para um novo arquivo."
+                )
+
+        # membros gzip concatenados: cada execução acrescenta ao mesmo arquivo
+        self.arquivo = gzip.open(caminho, "at", encoding="utf-8", newline="")
+        self.escritor = csv.DictWriter(self.arquivo, fieldnames=COLUNAS_EXCEL)
+        if novo:
+            self.escritor.writeheader()
+
+    def adicionar(self, json_dados) -> None:
+        avaliacao = como_avaliacao(json_dados)
+        linhas = list(linhas_tipadas(avaliacao))
+        self.escritor.writerows(linhas)
+
+        if self.substituir:
+            self.protocolos_novos.add(avaliacao.protocolo)
+            self.linhas_novas += len(linhas)
+
+    # as linhas desta execução são as últimas do arquivo; das anteriores,
+    # saem as dos protocolos refeitos
+    def _remover_substituidos(self) -> None:
+        def ler():
+            with gzip.open(self.caminho, "rt", encoding="utf-8", newline="") as f:
+                linhas = csv.reader(f)
+                next(linhas, None)  # cabeçalho
+                yield from linhas
+
+        total = sum(1 for _ in ler())
+        antigas = total - self.linhas_novas
+        if not any(
+            linha[_COLUNA_PROTOCOLO] in self.protocolos_novos
+            for _, linha in zip(range(antigas), ler())
+        ):
+            return
+
+        temporario = self.caminho.with_name(f"{self.caminho.name}.tmp")
+        with gzip.open(temporario, "wt", encoding="utf-8", newline="") as f:
+            escritor = csv.writer(f)
+            escritor.writerow(COLUNAS_EXCEL)
+            for numero, linha in enumerate(ler()):
+                if numero < antigas and linha[_COLUNA_PROTOCOLO] in self.protocolos_novos:
+                    continue
+                escritor.writerow(linha)
+        os.replace(temporario, self.caminho)
+
+    def fechar(self) -> None:
+        self.arquivo.close()
+        if self.substituir and self.protocolos_novos:
+            self._remover_substituidos()
+        print(f"✅ CSV gerado: {self.caminho}")
+
+# NDJSON do lote: um registro compacto por relatório, uma linha cada, com o
+# protocolo e o mesmo conteúdo do JSON por protocolo. Cada relatório é
+# acrescentado ao arquivo assim que termina, e descarregado em seguida
+# (quem lê o arquivo durante o lote vê todos os registros já gravados);
+# ".gz" e ".zst" no nome compactam (membros/frames concatenados: execuções
+# seguidas acrescentam ao mesmo arquivo). Usa o orjson, se instalado, no
+# lugar do json.
+def _serializador():
+    try:
+        import orjson
+    except ImportError:
+        return lambda registro: json.dumps(
+            registro,
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+    return orjson.dumps
+
+# modo: "ab" (acrescentar), "wb" ou "rb"; na leitura, todos os
+# membros/frames do arquivo
+def _abrir_compactado(caminho: Path, modo: str = "ab"):
+    if caminho.suffix == ".gz":
+        return gzip.open(caminho, modo)
+    if caminho.suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise RuntimeError(
+                "NDJSON compactado com zstd requer o pacote zstandard "
+                "(pip install zstandard)."
+            )
+        if modo == "rb":
+            return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(
+                open(caminho, "rb"),
+                read_across_frames=True,
+                closefd=True
+            ))
+        return zstandard.open(caminho, modo)
+    return open(caminho, modo)
+
+# o registro sempre começa pelo protocolo, nos dois serializadores
+_PROTOCOLO_NDJSON = re.compile(rb'\{"Protocolo":"([^"]*)"')
+
+class ArquivoNDJSON:
+    def __init__(self, caminho: Path, substituir: bool = False):
+        self.caminho = caminho
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        self.serializar = _serializador()
+        self.arquivo = _abrir_compactado(caminho)
+        self.substituir = substituir
+
+        # gzip: Z_SYNC_FLUSH fecha o bloco deflate atual sem reiniciar o
+        # dicionário (alguns bytes por registro); zstd: o flush padrão do
+        # zstandard fecha o bloco atual do frame
+        if caminho.suffix == ".gz":
+            self.descarregar = lambda: self.arquivo.flush(zlib.Z_SYNC_FLUSH)
+        else:
+            self.descarregar = self.arquivo.flush
+        self.protocolos_novos = set()
+        self.registros_novos = 0
+
+    def adicionar(self, json_dados) -> None:
+        avaliacao = como_avaliacao(json_dados)
+        registro = {"Protocolo": avaliacao.protocolo, **avaliacao.para_json()}
+        self.arquivo.write(self.serializar(registro) + b"\n")
+        self.descarregar()
+
+        if self.substituir:
+            self.protocolos_novos.add(avaliacao.protocolo.encode())
+            self.registros_novos += 1
+
+    # os registros desta execução são os últimos do arquivo; dos anteriores,
+    # saem os dos protocolos refeitos (o arquivo é regravado só se houver)
+    def _remover_substituidos(self) -> None:
+        def protocolo(linha: bytes) -> bytes:
+            encontrado = _PROTOCOLO_NDJSON.match(linha)
+            return encontrado.group(1) if encontrado else None
+
+        with _abrir_compactado(self.caminho, "rb") as f:
+            protocolos = [protocolo(linha) for linha in f]
+
+        antigos = len(protocolos) - self.registros_novos
+        if not self.protocolos_novos.intersection(protocolos[:antigos]):
+            return
+
+        temporario = self.caminho.with_name(
+            f"{self.caminho.stem}.tmp{self.caminho.suffix}"
+        )
+        with _abrir_compactado(self.caminho, "rb") as origem:
+            with _abrir_compactado(temporario, "wb") as destino:
+                for numero, linha in enumerate(origem):
+                    if numero < antigos and protocolos[numero] in self.protocolos_novos:
+                        continue
+                    destino.write(linha)
+        os.replace(temporario, self.caminho)
+
+    def fechar(self) -> None:
+        self.arquivo.close()
+        if self.substituir and self.protocolos_novos:
+            self._remover_substituidos()
+        print(f"✅ NDJSON gerado: {self.caminho}")
+
+def criar_exportador(formato: str, destino: Path, substituir: bool = False):
+    if formato == "parquet":
+        return ExportadorParquet(destino, substituir=substituir)
+    if formato == "csv":
+        return ExportadorCSV(destino, substituir=substituir)
+    raise ValueError(f"Formato de exportação desconhecido: {formato}")
+
+def docentes_para_excel(
+    docentes: list,
+    caminho_excel: Path
+) -> None:
+    if not docentes:
+        print("⚠️ Nenhum docente encontrado.")
+        return
+
+    import pandas as pd
+
+    df = pd.DataFrame(docentes)
+    df.to_excel(caminho_excel, index=False, engine="openpyxl")
+    print(f"✅ Excel de docentes gerado: {caminho_excel}")
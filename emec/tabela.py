@@ -0,0 +1,172 @@
+# Pós-processamento vetorizado de um bloco de relatórios
+#
+# montar_avaliacao trata um relatório por vez, item a item em Python. Num
+# reprocessamento com o texto já em cache, esse laço (a limpeza da
+# justificativa, principalmente) é o que sobra de CPU. Aqui os itens brutos
+# de muitos relatórios (título, nota e justificativa ainda sem limpeza)
+# entram numa única tabela pandas, e limpeza, sobreposição dos itens
+# avaliados, regra NSA, dimensão e nota numérica viram operações de coluna.
+# Com o pyarrow, as substituições por regex rodam no Arrow, fora do
+# interpretador. montar_avaliacoes(relatorios) devolve exatamente o mesmo
+# que [montar_avaliacao(r) for r in relatorios] (tests/test_tabela.py
+# confere com e sem o pyarrow).
+import sys
+
+from .extracao import (
+    PADRAO_LIXO,
+    limpar_justificativa,
+    notas_justificativas_brutas,
+    titulos_itens
+)
+from .relatorio import informacoes_curso
+from .registros import (
+    JUSTIFICATIVA_NSA,
+    NOTA_NSA,
+    NOTA_VAZIA,
+    PREFIXOS_DIMENSAO,
+    AvaliacaoCurso,
+    InformacoesCurso,
+    ItemAvaliado
+)
+
+TAMANHO_BLOCO = 200
+
+# o mesmo padrão de limpeza, com a flag embutida (o Arrow só recebe texto)
+PADRAO_LIXO_TEXTO = "(?i)" + PADRAO_LIXO.pattern
+
+# O Arrow usa o RE2, em que \d e \s são só ASCII ([0-9], [\t\n\f\r ]) e
+# o (?i) não junta "i" com "İ"/"ı", como faz o re do Python. Justificativas
+# com algum desses caracteres (dígito ou espaço fora do ASCII, \v, \x1c-\x1f,
+# İ, ı; raras no texto já limpo) são limpas pelo re, uma a uma.
+PADRAO_FORA_DO_RE2 = r"[\x0b\x1c-\x1f\x{85}\x{130}\x{131}]|[^\P{Nd}0-9]|[^\P{Z} ]"
+
+def _coluna_texto(valores: list):
+    import pandas as pd
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.Series(valores, dtype=object)
+    return pd.Series(valores, dtype="string[pyarrow]")
+
+# limpar_justificativa em toda a coluna
+def _limpar_justificativas(justificativas):
+    limpas = (
+        justificativas
+        .str.replace(PADRAO_LIXO_TEXTO, " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+    if justificativas.dtype == object:
+        return limpas  # sem o pyarrow, o próprio re do Python
+
+    fora = justificativas.str.contains(PADRAO_FORA_DO_RE2, regex=True)
+    fora = fora.to_numpy(dtype=bool)
+    if fora.any():
+        limpas[fora] = [limpar_justificativa(j) for j in justificativas[fora]]
+    return limpas
+
+def tabela_itens(relatorios: list):
+    import numpy as np
+    import pandas as pd
+
+    relatorio, titulo, nota, justificativa = [], [], [], []
+
+    for indice, r in enumerate(relatorios):
+        # todos os títulos entram primeiro, vazios; os avaliados vêm depois e
+        # prevalecem (mesma sobreposição do dict de montar_avaliacao)
+        for chave in titulos_itens(r.texto):
+            relatorio.append(indice)
+            titulo.append(chave)
+            nota.append("")
+            justificativa.append("")
+
+        for chave, conceito, bruta in notas_justificativas_brutas(r.texto):
+            relatorio.append(indice)
+            titulo.append(chave)
+            nota.append(conceito)
+            justificativa.append(bruta)
+
+    tabela = pd.DataFrame({
+        "relatorio": np.asarray(relatorio, dtype=np.int64),
+        "titulo": _coluna_texto(titulo),
+        "nota": _coluna_texto(nota),
+        "justificativa": _coluna_texto(justificativa)
+    })
+
+    tabela["justificativa"] = _limpar_justificativas(tabela["justificativa"])
+
+    tabela = tabela.drop_duplicates(["relatorio", "titulo"], keep="last")
+
+    # 🔥 REGRA FINAL: sem justificativa → Nota 6 + NSA
+    vazia = tabela["justificativa"] == ""
+    tabela.loc[vazia, "nota"] = "6"
+    tabela.loc[vazia, "justificativa"] = JUSTIFICATIVA_NSA
+
+    # dimensão pelo prefixo do título; fora das três dimensões não entra
+    dimensao = tabela["titulo"].str[:2].map(
+        {prefixo: i for i, prefixo in enumerate(PREFIXOS_DIMENSAO)}
+    )
+    tabela = tabela[dimensao.notna().to_numpy()].assign(
+        dimensao=dimensao.dropna().astype(np.int8).to_numpy()
+    )
+
+    # nota numérica, como em codificar_nota
+    digito = tabela["nota"].str.isdigit().to_numpy(dtype=bool)
+    nsa = (tabela["nota"].str.upper() == "NSA").to_numpy(dtype=bool)
+    vazio = (tabela["nota"] == "").to_numpy(dtype=bool)
+    if not (digito | nsa | vazio).all():
+        inesperada = tabela["nota"][~(digito | nsa | vazio)].iloc[0]
+        raise ValueError(f"Nota inesperada: {inesperada!r}")
+
+    codigo = np.full(len(tabela), NOTA_VAZIA, dtype=np.int8)
+    codigo[digito] = tabela["nota"][digito].astype(int).to_numpy()
+    codigo[nsa] = NOTA_NSA
+    tabela["codigo"] = codigo
+
+    # itens de uma mesma dimensão juntos, na ordem do título
+    return tabela.sort_values(
+        ["relatorio", "dimensao", "titulo"],
+        kind="stable",
+        ignore_index=True
+    )
+
+def montar_avaliacoes(relatorios: list) -> list:
+    import numpy as np
+
+    if not relatorios:
+        return []
+
+    tabela = tabela_itens(relatorios)
+
+    limites = np.searchsorted(
+        tabela["relatorio"].to_numpy(),
+        np.arange(len(relatorios) + 1)
+    ).tolist()
+    colunas = list(zip(
+        tabela["dimensao"].tolist(),
+        tabela["titulo"].tolist(),
+        tabela["codigo"].tolist(),
+        tabela["justificativa"].tolist()
+    ))
+
+    avaliacoes = []
+    for indice, r in enumerate(relatorios):
+        itens = tuple(
+            ItemAvaliado(
+                dimensao,
+                sys.intern(titulo),
+                codigo,
+                # a justificativa padrão vira a mesma string em todos os itens
+                JUSTIFICATIVA_NSA if justificativa == JUSTIFICATIVA_NSA else justificativa
+            )
+            for dimensao, titulo, codigo, justificativa
+            in colunas[limites[indice]:limites[indice + 1]]
+        )
+        avaliacoes.append(AvaliacaoCurso(
+            InformacoesCurso.de_dict(informacoes_curso(r)),
+            itens,
+            r.protocolo
+        ))
+
+    return avaliacoes
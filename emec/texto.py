@@ -0,0 +1,301 @@
+# Leitura do PDF página a página (com cache) e limpeza do texto
+import re
+import io
+import os
+import gzip
+import json
+import zlib
+import hashlib
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+# 1. PDF -> TEXTO
+# Cache persistente dos textos por página, chaveado pelo conteúdo do PDF
+# (o mesmo relatório com outro nome reaproveita a extração) e pela versão
+# do pdfplumber, separando a leitura seletiva (só as páginas relevantes,
+# ver classificacao.py) da leitura completa e os motores de extração (ver
+# motores.py). Entradas em JSON compactado; ao passar do limite de
+# tamanho, as menos usadas recentemente (mtime mais antigo) são removidas.
+# VERSAO_CACHE muda quando o formato das entradas muda (ou as páginas
+# que a leitura seletiva escolhe).
+VERSAO_CACHE = "4"
+
+# versão lida dos metadados do pacote, sem importar o pdfplumber: um lote
+# só de acertos no cache (ou de pulos pelo índice) não paga essa importação
+@lru_cache(maxsize=None)
+def versao_pdfplumber() -> str:
+    try:
+        return metadata.version("pdfplumber")
+    except metadata.PackageNotFoundError:
+        return ""
+
+# sha256 do conteúdo do PDF (arquivo ou buffer), precedido de `prefixo`
+def hash_pdf(caminho_pdf: Path, prefixo: str = "") -> str:
+    h = hashlib.sha256()
+    h.update(prefixo.encode())
+    if not e_caminho(caminho_pdf):
+        h.update(caminho_pdf)
+        return h.hexdigest()
+
+    with open(caminho_pdf, "rb") as f:
+        for bloco in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+class CacheTextos:
+    def __init__(self, pasta: Path, limite_mb: int = 1024):
+        self.pasta = pasta
+        self.limite = limite_mb * 1024 * 1024
+        self.pasta.mkdir(parents=True, exist_ok=True)
+        self.tamanho = sum(a.stat().st_size for a in self.pasta.glob("*.json.gz"))
+        self.acertos = 0
+
+    # motor: ExtratorTexto.identificacao ("" = pdfplumber)
+    def chave(self, caminho_pdf: Path, seletiva: bool = True, motor: str = "") -> str:
+        leitura = "seletiva" if seletiva else "completa"
+        if motor:
+            leitura = f"{leitura}:{motor}"
+        return hash_pdf(
+            caminho_pdf,
+            f"{VERSAO_CACHE}:{versao_pdfplumber()}:{leitura}"
+        )
+
+    def ler(self, chave: str):
+        arquivo = self.pasta / f"{chave}.json.gz"
+        try:
+            with gzip.open(arquivo, "rt", encoding="utf-8") as f:
+                paginas = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, zlib.error):
+            # entrada truncada ou corrompida: conta como falha e sai do
+            # cache, para ser refeita em vez de falhar a cada execução
+            self.descartar(arquivo)
+            return None
+
+        try:
+            os.utime(arquivo)  # marca como usado recentemente
+        except FileNotFoundError:
+            pass  # despejada por outro processo depois da leitura
+        self.acertos += 1
+        return paginas
+
+    def descartar(self, arquivo: Path) -> None:
+        try:
+            tamanho = arquivo.stat().st_size
+            arquivo.unlink()
+        except FileNotFoundError:
+            return
+        self.tamanho -= tamanho
+
+    # como no índice: a entrada só é publicada (os.replace) depois de estar
+    # inteira no disco, então uma queda não deixa uma entrada pela metade
+    def gravar(self, chave: str, paginas: list) -> None:
+        arquivo = self.pasta / f"{chave}.json.gz"
+        temporario = arquivo.with_name(f"{chave}.{os.getpid()}.tmp")
+        with open(temporario, "wb") as bruto:
+            with gzip.open(bruto, "wt", encoding="utf-8") as f:
+                json.dump(paginas, f, ensure_ascii=False)
+            bruto.flush()
+            os.fsync(bruto.fileno())
+        os.replace(temporario, arquivo)
+
+        self.tamanho += arquivo.stat().st_size
+        if self.tamanho > self.limite:
+            self.despejar()
+
+    def despejar(self) -> None:
+        entradas = []
+        for arquivo in self.pasta.glob("*.json.gz"):
+            try:
+                st = arquivo.stat()
+            except FileNotFoundError:
+                continue
+            entradas.append((st.st_mtime, st.st_size, arquivo))
+
+        entradas.sort()
+        self.tamanho = sum(tamanho for _, tamanho, _ in entradas)
+
+        # libera até 90% do limite para não despejar a cada gravação
+        for _, tamanho, arquivo in entradas:
+            if self.tamanho <= self.limite * 0.9:
+                break
+            try:
+                arquivo.unlink()
+            except FileNotFoundError:
+                pass
+            self.tamanho -= tamanho
+
+# Em todo este módulo, caminho_pdf pode ser também o conteúdo do PDF já
+# em memória: bytes (modo assíncrono, pré-leitura) ou um mmap da cópia
+# local (pré-leitura com pasta local, ver entrada.py).
+def e_caminho(caminho_pdf) -> bool:
+    return isinstance(caminho_pdf, (str, os.PathLike))
+
+# Fluxo somente leitura sobre um buffer em memória: cada abertura do PDF tem
+# a sua posição e nada é copiado além do trecho lido. Para bytes basta o
+# BytesIO, que também compartilha o buffer enquanto não há escrita.
+class FluxoMemoria(io.RawIOBase):
+    def __init__(self, buffer):
+        self._dados = memoryview(buffer)
+        self._posicao = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._posicao
+
+    def seek(self, deslocamento: int, referencia: int = io.SEEK_SET) -> int:
+        if referencia == io.SEEK_CUR:
+            deslocamento += self._posicao
+        elif referencia == io.SEEK_END:
+            deslocamento += len(self._dados)
+        self._posicao = max(deslocamento, 0)
+        return self._posicao
+
+    def read(self, tamanho: int = -1) -> bytes:
+        inicio = min(self._posicao, len(self._dados))
+        fim = len(self._dados) if tamanho is None or tamanho < 0 else inicio + tamanho
+        trecho = self._dados[inicio:fim].tobytes()
+        self._posicao = inicio + len(trecho)
+        return trecho
+
+    def readinto(self, destino) -> int:
+        trecho = self.read(len(destino))
+        destino[:len(trecho)] = trecho
+        return len(trecho)
+
+# o que o pypdfium2 aceita: caminho, bytes ou um fluxo (o pdfplumber não
+# aceita bytes, que viram um BytesIO)
+def fonte_pdf(caminho_pdf):
+    if e_caminho(caminho_pdf) or isinstance(caminho_pdf, bytes):
+        return caminho_pdf
+    return FluxoMemoria(caminho_pdf)
+
+def abrir_pdf(caminho_pdf: Path):
+    import pdfplumber
+
+    fonte = fonte_pdf(caminho_pdf)
+    if isinstance(fonte, bytes):
+        fonte = io.BytesIO(fonte)
+    return pdfplumber.open(fonte)
+
+# Leitura em fluxo: o pdfplumber guarda os objetos de layout (chars, linhas,
+# etc.) de cada página até o PDF ser fechado; fechar a página logo após
+# extrair o texto mantém a memória no tamanho de uma página por vez.
+# Páginas sem texto (ou fora de `paginas`, quando informado) saem como ""
+# para preservar a numeração das páginas.
+def iterar_paginas(
+    caminho_pdf: Path,
+    inicio: int = 0,
+    fim: int = None,
+    paginas: set = None
+):
+    with abrir_pdf(caminho_pdf) as pdf:
+        for indice, pagina in enumerate(pdf.pages[inicio:fim], start=inicio):
+            if paginas is not None and indice not in paginas:
+                yield ""
+                continue
+
+            try:
+                conteudo = pagina.extract_text()
+            finally:
+                pagina.close()
+
+            yield conteudo or ""
+
+def juntar_paginas(paginas: list, separador: str) -> str:
+    return separador.join(p for p in paginas if p)
+
+# motor: um motores.ExtratorTexto; sem ele, pdfplumber como sempre
+def extrair_paginas(
+    caminho_pdf: Path,
+    cache: CacheTextos = None,
+    seletiva: bool = True,
+    motor=None
+) -> list:
+    if cache:
+        chave = cache.chave(caminho_pdf, seletiva, motor.identificacao if motor else "")
+        paginas = cache.ler(chave)
+        if paginas is not None:
+            return paginas
+
+    relevantes = None
+    if seletiva:
+        from .classificacao import classificar_paginas
+        relevantes = classificar_paginas(caminho_pdf)
+
+    if motor:
+        paginas = motor.extrair(caminho_pdf, relevantes)
+    else:
+        paginas = list(iterar_paginas(caminho_pdf, paginas=relevantes))
+
+    if cache:
+        cache.gravar(chave, paginas)
+
+    return paginas
+
+def pdf_para_texto(
+    caminho_pdf: Path,
+    cache: CacheTextos = None,
+    seletiva: bool = True,
+    motor=None
+) -> str:
+    return juntar_paginas(extrair_paginas(caminho_pdf, cache, seletiva, motor), " ")
+
+def pdf_para_texto_bruto(
+    caminho_pdf: Path,
+    cache: CacheTextos = None,
+    seletiva: bool = True,
+    motor=None
+) -> str:
+    return juntar_paginas(extrair_paginas(caminho_pdf, cache, seletiva, motor), "\n")
+
+# 2. LIMPEZA DO TEXTO
+# Ruídos de cabeçalho/rodapé do navegador, compilados uma única vez.
+# A ordem importa: cada padrão roda sobre o resultado do anterior
+# (ex.: em "\nNSA\n5\n" a linha do número sai antes da linha "NSA"),
+# por isso não dá para juntar tudo numa só alternância sem mudar a saída.
+# Com os padrões ainda em sequência, o que muda em relação à limpeza
+# original é a passada de \n/\r a menos e a compilação antecipada (que o
+# cache do re já fazia): num texto de ~700 mil caracteres, as duas ficam
+# entre 90 e 135 ms por chamada, sem diferença mensurável. Cada padrão com
+# IGNORECASE custa uma passada de ~10 ms. tests/test_limpeza.py confere a
+# saída byte a byte.
+PADROES_RUIDO = [
+    r'about:blank',
+    r'\n\s*\d+\s*\n',
+    r'\n\s*NSA\s*\n',
+    r'Firefox.*?\d{2}:\d{2}:\d{2}',
+    r'Firefox.*?\d{2}/\d{2}/\d{4}',
+    r'Data\s*\d{2}/\d{2}/\d{4}',
+    r'Hora\s*\d{2}:\d{2}(:\d{2})?',
+    r'Página\s*\d+\s*de\s*\d+',
+    r'\bblank\b',
+]
+
+_ESPACOS = re.compile(r'\s+')
+
+class LimpadorTexto:
+    def __init__(self, padroes: list = PADROES_RUIDO):
+        self.padroes = [re.compile(p, re.IGNORECASE) for p in padroes]
+
+    def limpar(self, texto: str) -> str:
+        for padrao in self.padroes:
+            texto = padrao.sub(' ', texto)
+
+        # \s+ já cobre \n e \r: uma passada só para todo espaço em branco
+        texto = _ESPACOS.sub(' ', texto)
+        texto = texto.replace(" :", ":").replace(" .", ".")
+
+        return texto.strip()
+
+_LIMPADOR_PADRAO = LimpadorTexto()
+
+def limpar_texto(texto: str, limpador: LimpadorTexto = None) -> str:
+    return (limpador or _LIMPADOR_PADRAO).limpar(texto)
@@ -0,0 +1,20 @@
+# Entrada do cache de textos truncada (gravação interrompida): vira falha,
+# sai do cache e é refeita na leitura seguinte
+from benchmark import gerar_relatorio_sintetico
+from emec.texto import CacheTextos, extrair_paginas
+
+def test_entrada_truncada_e_refeita(tmp_path):
+    pdf = gerar_relatorio_sintetico(tmp_path / "relatorio.pdf", paginas=4)
+    cache = CacheTextos(tmp_path / "CACHE")
+    paginas = extrair_paginas(pdf, cache)
+
+    chave = cache.chave(pdf)
+    entrada = tmp_path / "CACHE" / f"{chave}.json.gz"
+    conteudo = entrada.read_bytes()
+    entrada.write_bytes(conteudo[:len(conteudo) // 2])
+
+    assert cache.ler(chave) is None
+    assert not entrada.exists()
+
+    assert extrair_paginas(pdf, cache) == paginas
+    assert cache.ler(chave) == paginas
@@ -0,0 +1,53 @@
+# Tabela do CONCEITO FINAL quebrada entre duas páginas: os valores, na
+# página seguinte, são lidos também na leitura seletiva
+import random
+
+from benchmark import LINHAS_POR_PAGINA, _frase, _pdf_bytes
+from emec.relatorio import informacoes_curso, ler_relatorio
+
+TOTAL_PAGINAS = 5
+
+def _pagina(r: random.Random, numero: int, inicio=(), fim=()) -> list:
+    enchimento = LINHAS_POR_PAGINA - 3 - len(inicio) - len(fim)
+    return (
+        ["about:blank", f"Firefox 12/03/2023 10:{numero:02d}:00"]
+        + list(inicio)
+        + [_frase(r, 8, 16).capitalize() + "." for _ in range(enchimento)]
+        + list(fim)
+        + [f"Página {numero + 1} de {TOTAL_PAGINAS}"]
+    )
+
+def _relatorio_com_tabela_quebrada(caminho):
+    r = random.Random(0)
+    cabecalho = [
+        "Protocolo: 202300001",
+        "Curso(s) / Habilitação(ões) sendo avaliado(s):",
+        "ADMINISTRAÇÃO",
+        "Informações da comissão:",
+        "Endereço da IES: 12345 - UNASP campus Engenheiro Coelho - Estrada Municipal",
+        "Ato Regulatório: Reconhecimento",
+        "Data de 12/03/2019 a 15/03/2019",
+    ]
+    paginas = [
+        _pagina(r, 0, inicio=cabecalho),
+        _pagina(r, 1, inicio=["Dimensão 1: ORGANIZAÇÃO DIDÁTICO-PEDAGÓGICA"]),
+        # o título da tabela fecha a página e os valores abrem a seguinte
+        _pagina(
+            r,
+            2,
+            inicio=["Dimensão 2: CORPO DOCENTE"],
+            fim=["CONCEITO FINAL CONTÍNUO CONCEITO FINAL FAIXA"]
+        ),
+        _pagina(r, 3, inicio=["3,45 4"]),
+        _pagina(r, 4),  # anexo, fora da leitura seletiva
+    ]
+    caminho.write_bytes(_pdf_bytes(paginas))
+    return caminho
+
+def test_conceito_na_pagina_seguinte(tmp_path):
+    pdf = _relatorio_com_tabela_quebrada(tmp_path / "relatorio.pdf")
+
+    for seletiva in (True, False):
+        info = informacoes_curso(ler_relatorio(pdf, seletiva=seletiva))
+        assert info["CONCEITO FINAL CONTÍNUO"] == "3,45"
+        assert info["CONCEITO FINAL FAIXA"] == "4"
@@ -0,0 +1,53 @@
+# Docentes a partir do texto já extraído: sem cabeçalho/rodapé do navegador
+# no nome e com o registro que continua na página seguinte
+from emec.relatorio import RelatorioPDF, extrair_docentes
+from emec.extracao import localizar_paginas_docentes
+
+INFO_CURSO = {
+    "Nome": "ADMINISTRAÇÃO",
+    "Campus": "Campus Central",
+    "Ano da avaliação": "2019",
+    "Ato Regulatório": "Reconhecimento"
+}
+
+PAGINAS = [
+    "about:blank\n"
+    "Firefox 12/03/2023 10:01:00\n"
+    "Texto descritivo da comissão.\n"
+    "Página 1 de 3",
+
+    "about:blank\n"
+    "Firefox 12/03/2023 10:02:00\n"
+    "DOCENTES\n"
+    "Nome do Docente Titulação Regime de Trabalho Vínculo Empregatício\n"
+    "Tempo de vínculo ininterrupto do docente com o curso (em meses)\n"
+    "Ana Souza Doutorado Integral CLT 12 Mês(es)\n"
+    "Bruno de\n"
+    "2\n"
+    "Página 2 de 3",
+
+    "about:blank\n"
+    "Firefox 12/03/2023 10:03:00\n"
+    "Oliveira Mestrado Parcial Outro 48 Mês(es)\n"
+    "Carla Dias Especialização Horista CLT 7 Mês(es)\n"
+    "CATEGORIAS AVALIADAS\n"
+    "Página 3 de 3"
+]
+
+def test_docentes_do_texto_entre_paginas():
+    relatorio = RelatorioPDF(
+        caminho=None,  # sem reabrir o PDF: o texto basta
+        paginas=PAGINAS,
+        paginas_docentes=localizar_paginas_docentes(PAGINAS)
+    )
+
+    docentes = extrair_docentes(relatorio, "Reconhecimento", INFO_CURSO)
+
+    assert [
+        (d["Nome do Docente"], d["Titulação"], d["Tempo de vínculo (meses)"])
+        for d in docentes
+    ] == [
+        ("Ana Souza", "Doutorado", "12"),
+        ("Bruno de Oliveira", "Mestrado", "48"),
+        ("Carla Dias", "Especialização", "7")
+    ]
@@ -0,0 +1,47 @@
+# O mesmo relatório com vários nomes, processado em paralelo: só a primeira
+# cópia é gravada (JSON/Excel, índice, consolidado e NDJSON)
+import gzip
+import shutil
+
+import pandas as pd
+
+from benchmark import gerar_relatorio_sintetico
+from emec.indice import ARQUIVO_INDICE
+from emec.lote import processar_pasta_pdfs
+
+PROTOCOLO = "202300001"
+
+def test_copias_em_paralelo_gravadas_uma_vez(tmp_path):
+    pdfs = tmp_path / "PDFs"
+    pdfs.mkdir()
+    gerar_relatorio_sintetico(
+        pdfs / "original.pdf",
+        paginas=6,
+        itens_por_dimensao=3,
+        docentes=3,
+        protocolo=PROTOCOLO,
+        semente=0
+    )
+    for copia in range(1, 4):
+        shutil.copy(pdfs / "original.pdf", pdfs / f"copia{copia}.pdf")
+
+    processar_pasta_pdfs(
+        pdfs,
+        tmp_path / "JSON",
+        tmp_path / "EXCEL",
+        workers=4,
+        arquivos_por_worker=0,
+        consolidado=tmp_path / "consolidado.xlsx",
+        ndjson=tmp_path / "lote.ndjson.gz"
+    )
+
+    indice = (tmp_path / "EXCEL" / ARQUIVO_INDICE).read_text().splitlines()
+    assert len(indice) == 1
+
+    with gzip.open(tmp_path / "lote.ndjson.gz", "rt", encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+
+    consolidado = pd.read_excel(tmp_path / "consolidado.xlsx", dtype=str)
+    unico = pd.read_excel(tmp_path / "EXCEL" / f"{PROTOCOLO}.xlsx", dtype=str)
+    assert len(consolidado) == len(unico)
+    assert set(consolidado["Protocolo"]) == {PROTOCOLO}
@@ -0,0 +1,68 @@
+# LimpadorTexto x limpeza original (sequencial, com re.sub por padrão)
+import re
+import random
+
+from emec.texto import PADROES_RUIDO, LimpadorTexto, limpar_texto
+
+# cópia da limpar_texto original dos scripts, antes do LimpadorTexto
+def limpar_texto_original(texto: str) -> str:
+    padroes_remover = [
+        r'about:blank',
+        r'\n\s*\d+\s*\n',
+        r'\n\s*NSA\s*\n',
+        r'Firefox.*?\d{2}:\d{2}:\d{2}',
+        r'Firefox.*?\d{2}/\d{2}/\d{4}',
+        r'Data\s*\d{2}/\d{2}/\d{4}',
+        r'Hora\s*\d{2}:\d{2}(:\d{2})?',
+        r'Página\s*\d+\s*de\s*\d+',
+        r'\bblank\b',
+    ]
+
+    for p in padroes_remover:
+        texto = re.sub(p, ' ', texto, flags=re.IGNORECASE)
+
+    texto = texto.replace("\n", " ").replace("\r", " ")
+    texto = re.sub(r'\s+', ' ', texto)
+    texto = texto.replace(" :", ":").replace(" .", ".")
+
+    return texto.strip()
+
+# trechos de cabeçalho/rodapé do navegador e casos em que a ordem importa
+FRAGMENTOS = [
+    "about:blank", "ABOUT:BLANK", "blank", "blankHora12:00", "Hora 12:30:45",
+    "Firefox", "Firefox 12/03/2023 10:00:00", "Firefox\n12/03/2023",
+    "Data 01/02/2024", "Data de 12/03/2021 a 15/03/2021", "Página 3 de 10",
+    "página 1 de 2", "\n", "\r\n", " \n 5 \n", "\nNSA\n", "\nNSA\n5\n",
+    "NSA", "5", " : ", " . ", "1.1. Título do item.",
+    "Justificativa para conceito 4:", "Dimensão 2", "Ato Regulatório: ",
+    "texto qualquer", "ção", "\t", "  ",
+]
+
+def _amostras(quantidade: int = 3000, semente: int = 2024) -> list:
+    aleatorio = random.Random(semente)
+    amostras = ["", " ", "\n\n", "\nNSA\n5\n", "blankHora12:00"]
+    for _ in range(quantidade):
+        amostras.append("".join(
+            aleatorio.choice(FRAGMENTOS)
+            for _ in range(aleatorio.randint(1, 40))
+        ))
+    return amostras
+
+def test_limpeza_identica_a_original():
+    for amostra in _amostras():
+        assert limpar_texto(amostra) == limpar_texto_original(amostra), repr(amostra)
+
+def test_limpador_com_padroes_explicitos_identico():
+    limpador = LimpadorTexto(PADROES_RUIDO)
+    for amostra in _amostras(500, semente=7):
+        assert limpador.limpar(amostra) == limpar_texto_original(amostra)
+
+# texto real extraído de um relatório sintético (com cabeçalho e rodapé do Firefox)
+def test_relatorio_sintetico_identico(tmp_path):
+    from benchmark import gerar_relatorio_sintetico
+    from emec.texto import pdf_para_texto_bruto
+
+    pdf = gerar_relatorio_sintetico(tmp_path / "relatorio.pdf", paginas=6)
+    texto = pdf_para_texto_bruto(pdf, seletiva=False)
+    assert "Firefox" in texto
+    assert limpar_texto(texto) == limpar_texto_original(texto)
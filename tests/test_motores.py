@@ -0,0 +1,42 @@
+# Total de PDFs por motor no fim do lote, também com processos (a contagem
+# de cada worker volta com o resultado) e com o recuo para o pdfplumber
+import pytest
+
+from benchmark import gerar_relatorio_sintetico
+from emec.lote import processar_pasta_pdfs
+from emec.motores import MotorPdfium
+
+pytest.importorskip("pypdfium2")
+
+def _lote(tmp_path, workers: int) -> None:
+    (tmp_path / "PDFs").mkdir()
+    for semente in range(3):
+        gerar_relatorio_sintetico(
+            tmp_path / "PDFs" / f"{semente}.pdf",
+            paginas=4,
+            protocolo=f"20230000{semente}",
+            semente=semente
+        )
+
+    processar_pasta_pdfs(
+        tmp_path / "PDFs",
+        tmp_path / "JSON",
+        tmp_path / "EXCEL",
+        workers=workers,
+        motor="pdfium"
+    )
+
+def test_total_por_motor_com_workers(tmp_path, capsys):
+    _lote(tmp_path, workers=2)
+    assert "🔧 PDFs extraídos por motor: pdfium 3\n" in capsys.readouterr().out
+
+def test_total_com_recuo(tmp_path, capsys, monkeypatch):
+    def falhar(self, caminho_pdf, paginas=None):
+        raise ValueError("falha simulada")
+
+    monkeypatch.setattr(MotorPdfium, "extrair", falhar)
+    _lote(tmp_path, workers=1)
+    assert (
+        "🔧 PDFs extraídos por motor: pdfplumber (recuo) 3\n"
+        in capsys.readouterr().out
+    )
@@ -0,0 +1,80 @@
+# --reprocessar-desatualizados: o protocolo refeito não se repete nas saídas
+# acrescentadas (planilha consolidada, Parquet/CSV e NDJSON)
+import gzip
+import json
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from benchmark import gerar_relatorio_sintetico
+from emec.indice import ARQUIVO_INDICE, versao_extrator
+from emec.lote import processar_pasta_pdfs
+
+PROTOCOLOS = ("202300001", "202300002")
+
+def _processar(pasta, exportar: str, reprocessar: bool = False) -> None:
+    processar_pasta_pdfs(
+        pasta / "PDFs",
+        pasta / "JSON",
+        pasta / "EXCEL",
+        reprocessar_desatualizados=reprocessar,
+        consolidado=pasta / "consolidado.xlsx",
+        exportar=exportar,
+        destino_exportacao=pasta / ("parquet" if exportar == "parquet" else "lote.csv.gz"),
+        ndjson=pasta / "lote.ndjson.gz"
+    )
+
+def _linhas_por_protocolo(pasta, exportar: str) -> dict:
+    if exportar == "parquet":
+        exportado = pd.read_parquet(pasta / "parquet")
+    else:
+        exportado = pd.read_csv(pasta / "lote.csv.gz", dtype=str)
+
+    with gzip.open(pasta / "lote.ndjson.gz", "rt", encoding="utf-8") as f:
+        ndjson = [json.loads(linha)["Protocolo"] for linha in f]
+
+    return {
+        "consolidado": Counter(
+            pd.read_excel(pasta / "consolidado.xlsx", dtype=str)["Protocolo"]
+        ),
+        "exportado": Counter(exportado["Protocolo"].astype(str)),
+        "ndjson": Counter(ndjson)
+    }
+
+def _desatualizar(pasta, protocolo: str) -> None:
+    indice = pasta / "EXCEL" / ARQUIVO_INDICE
+    registros = [json.loads(linha) for linha in indice.read_text().splitlines()]
+    for registro in registros:
+        if registro["protocolo"] == protocolo:
+            registro["versao"] = "antiga"
+    indice.write_text("".join(json.dumps(r) + "\n" for r in registros))
+
+@pytest.mark.parametrize("exportar", ["csv", "parquet"])
+def test_reprocessar_nao_duplica(tmp_path, exportar):
+    (tmp_path / "PDFs").mkdir()
+    for semente, protocolo in enumerate(PROTOCOLOS):
+        gerar_relatorio_sintetico(
+            tmp_path / "PDFs" / f"{protocolo}.pdf",
+            paginas=6,
+            itens_por_dimensao=4,
+            docentes=3,
+            protocolo=protocolo,
+            semente=semente
+        )
+
+    _processar(tmp_path, exportar)
+    antes = _linhas_por_protocolo(tmp_path, exportar)
+    assert set(antes["ndjson"]) == set(PROTOCOLOS)
+    assert all(antes["ndjson"][p] == 1 for p in PROTOCOLOS)
+
+    _desatualizar(tmp_path, PROTOCOLOS[0])
+    _processar(tmp_path, exportar, reprocessar=True)
+
+    indice = (tmp_path / "EXCEL" / ARQUIVO_INDICE).read_text().splitlines()
+    assert json.loads(indice[-1]) == {
+        "protocolo": PROTOCOLOS[0],
+        "versao": versao_extrator(),
+        "origem": json.loads(indice[-1])["origem"]
+    }
+    assert _linhas_por_protocolo(tmp_path, exportar) == antes
@@ -0,0 +1,100 @@
+# segmentar_itens x regex original de nota + justificativa (uma busca
+# preguiçosa com DOTALL a partir de cada título)
+import re
+import random
+
+from emec.extracao import extrair_notas_justificativas, limpar_justificativa
+
+# cópia do padrão original dos scripts, antes de segmentar_itens
+PADRAO_ITEM_AVALIADO = re.compile(
+    r'(?P<titulo>\d+\.\d+\.\s+[^.]+?\.)\s*'
+    r'(?:[\d,]+\s*)?'
+    r'.*?'
+    r'Justificativa\s+para\s+conceito\s+(?P<conceito>\d|NSA)\s*:'
+    r'(?P<justificativa>.*?)'
+    r'(?=\s+\d+\.\d+\.\s+[A-Z]|\s+Dimensão\s+\d+|\Z)',
+    re.IGNORECASE | re.DOTALL
+)
+
+def extrair_notas_justificativas_original(texto: str) -> dict:
+    resultado = {}
+
+    for m in PADRAO_ITEM_AVALIADO.finditer(texto):
+        resultado[m.group("titulo").strip()] = {
+            "Nota": m.group("conceito").strip(),
+            "Justificativa": limpar_justificativa(m.group("justificativa"))
+        }
+
+    return resultado
+
+PALAVRAS = (
+    "curso projeto pedagógico docentes discentes atividades ensino pesquisa "
+    "extensão estágio acervo bibliografia laboratório práticas coordenação "
+    "colegiado avaliação"
+).split()
+
+# ruído do navegador que sobra na justificativa (sai em limpar_justificativa)
+RUIDO = ["Firefox", "about:blank", "12/03/2023, 10:01:00", "3 of 10"]
+
+def _frase(r: random.Random, ruido: bool = False) -> str:
+    palavras = PALAVRAS + RUIDO if ruido else PALAVRAS
+    return " ".join(r.choice(palavras) for _ in range(r.randint(3, 12)))
+
+# texto limpo (como o de RelatorioPDF.texto) com todos os itens justificados
+def _texto_justificado(semente: int) -> str:
+    r = random.Random(semente)
+    partes = []
+    for dimensao in range(1, r.randint(2, 4)):
+        partes.append(f"Dimensão {dimensao}: {_frase(r).upper()}")
+        for item in range(1, r.randint(2, 15)):
+            partes.append(f"{dimensao}.{item}. {_frase(r).capitalize()}.")
+            if r.random() < 0.5:
+                partes.append(r.choice(["3", "4,5", "5"]))
+            conceito = r.choice(["1", "2", "3", "4", "5", "NSA"])
+            partes.append(f"Justificativa para conceito {conceito}:")
+            partes += [
+                _frase(r, ruido=True).capitalize() + "."
+                for _ in range(r.randint(0, 4))
+            ]
+    return " ".join(partes)
+
+def test_itens_justificados_identicos_ao_original():
+    for semente in range(300):
+        texto = _texto_justificado(semente)
+        assert (
+            extrair_notas_justificativas(texto)
+            == extrair_notas_justificativas_original(texto)
+        ), semente
+
+# um item sem justificativa: o padrão original levava a nota e a
+# justificativa do item seguinte para ele (e o seguinte sumia)
+def test_item_sem_justificativa_nao_leva_a_do_seguinte():
+    texto = (
+        "Dimensão 1: ORGANIZAÇÃO DIDÁTICO-PEDAGÓGICA "
+        "1.1. Políticas institucionais. "
+        "1.2. Objetivos do curso. 4 Justificativa para conceito 4: "
+        "Os objetivos estão descritos. "
+        "1.3. Perfil do egresso. Justificativa para conceito 5: "
+        "O perfil está implantado."
+    )
+
+    assert extrair_notas_justificativas_original(texto) == {
+        "1.1. Políticas institucionais.": {
+            "Nota": "4",
+            "Justificativa": "Os objetivos estão descritos."
+        },
+        "1.3. Perfil do egresso.": {
+            "Nota": "5",
+            "Justificativa": "O perfil está implantado."
+        }
+    }
+    assert extrair_notas_justificativas(texto) == {
+        "1.2. Objetivos do curso.": {
+            "Nota": "4",
+            "Justificativa": "Os objetivos estão descritos."
+        },
+        "1.3. Perfil do egresso.": {
+            "Nota": "5",
+            "Justificativa": "O perfil está implantado."
+        }
+    }
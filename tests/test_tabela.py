@@ -0,0 +1,57 @@
+# montar_avaliacoes (bloco vetorizado) x montar_avaliacao (um a um), com as
+# regex no Arrow (RE2, com o pyarrow) e no re do Python (coluna object)
+import sys
+
+import pytest
+
+from benchmark import gerar_relatorio_sintetico
+from emec.relatorio import RelatorioPDF, ler_relatorio, montar_avaliacao
+from emec.tabela import montar_avaliacoes, tabela_itens
+from emec.texto import limpar_texto
+
+# onde o RE2 e o re divergem: dígitos fora do ASCII, "ı"/"İ" no (?i)
+TEXTOS = [
+    "Dimensão 1: ORGANIZAÇÃO 1.1. Políticas institucionais. Justificativa "
+    "para conceito 4: Atende 12/03/2023, 10:01:00 PM bem. Firefox 3 of 10 "
+    "1.2. Objetivos do curso. 1.3. Perfil do egresso. Justificativa para "
+    "conceito NSA: Dimensão 2: CORPO DOCENTE 2.1. Titulação. 5 "
+    "Justificativa para conceito 5: Todos doutores. about:blank",
+    "Dimensão 1: X 1.1. Políticas. Justificativa para conceito 3: Data "
+    "١٢/٠٣/٢٠٢٣ 10:01 e ３ of ４ páginas, Fırefox e ABOUT:BLANK. 1.2. Outro. "
+    "Justificativa para conceito ٤: Sem ruído.",
+    "Dimensão 3: INFRAESTRUTURA 3.1. Espaço de trabalho. Justificativa para "
+    "conceito nsa: Não se aplica ao curso İ.",
+]
+
+@pytest.fixture(scope="module")
+def relatorios(tmp_path_factory):
+    pasta = tmp_path_factory.mktemp("PDFs")
+    lidos = [
+        ler_relatorio(
+            gerar_relatorio_sintetico(
+                pasta / f"{semente}.pdf",
+                paginas=6,
+                itens_por_dimensao=8,
+                protocolo=f"20230000{semente}",
+                semente=semente
+            ),
+            seletiva=False
+        )
+        for semente in range(3)
+    ]
+    return lidos + [
+        RelatorioPDF(caminho=None, texto=limpar_texto(texto), protocolo=str(i))
+        for i, texto in enumerate(TEXTOS)
+    ]
+
+@pytest.mark.parametrize("pyarrow", [True, False], ids=["arrow", "object"])
+def test_bloco_identico_ao_um_a_um(relatorios, pyarrow, monkeypatch):
+    if pyarrow:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setitem(sys.modules, "pyarrow", None)  # import falha
+
+    dtype = tabela_itens(relatorios)["justificativa"].dtype
+    assert (dtype == object) != pyarrow
+
+    assert montar_avaliacoes(relatorios) == [montar_avaliacao(r) for r in relatorios]